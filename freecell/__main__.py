@@ -1,11 +1,57 @@
-from .game import Game
+import argparse
+
+from .profiler import StartupProfiler
 
 
 def main() -> None:
     """Game entry point"""
-    game = Game()
+    parser = argparse.ArgumentParser(prog="freecell")
+    parser.add_argument("--profile-startup", action="store_true", help="print the duration of the startup phases")
+    parser.add_argument("--profile-json", help="write the duration of the startup phases to a JSON file")
+    parser.add_argument("--quit-after-first-frame", action="store_true", help="quit once the first frame is shown")
+    parser.add_argument(
+        "--transitions",
+        type=int,
+        default=0,
+        help="switch between the menu and the game this many times after the first frame",
+    )
+    parser.add_argument("--replay", help="play back a game recorded in a replay file")
+    parser.add_argument("--replay-index", type=int, default=0, help="position of the game in the replay file")
+    parser.add_argument("--replay-speed", type=float, default=1.0, help="speed factor of the replay")
+    args = parser.parse_args()
+
+    profiler = StartupProfiler()
+
+    with profiler.phase("imports"):
+        from .game import Game
+
+    game = Game(profiler)
     game.ready()
 
+    with profiler.phase("first frame"):
+        game.process()
+
+    for _ in range(args.transitions):
+        for scene in ("MainScene", "MenuScene"):
+            game.change_scene(scene)
+            game.process()
+
+    if args.replay:
+        from .replay import read_replays
+
+        replay = read_replays(args.replay)[args.replay_index]
+        game.change_scene("MainScene")
+        game.scenes["MainScene"].play_replay(replay, args.replay_speed)
+
+    if args.profile_startup:
+        print(profiler.report())
+
+    if args.profile_json:
+        profiler.dump(args.profile_json)
+
+    if args.quit_after_first_frame:
+        game.is_running = False
+
     while game.is_running:
         game.process()
 
@@ -0,0 +1,268 @@
+from __future__ import annotations
+
+import argparse
+import bisect
+import json
+import mmap
+import os
+import sys
+import time
+from array import array
+from collections import Counter
+from collections.abc import Iterator
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+from .deals import deal_layout
+from .journal import decode_move
+from .replay import (
+    HEADER,
+    ILLEGAL,
+    SOLVED,
+    UNFINISHED,
+    get_record_size,
+    read_delays,
+    read_header,
+    validate_moves,
+)
+from .state import GameState, Zone
+
+# Upper bounds in milliseconds of the buckets of the time taken by a move, the last bucket has no bound
+TIME_BUCKETS = (250, 500, 1000, 2000, 4000, 8000, 16000, 32000)
+
+# Name of the type of a move, indexed by source zone * 3 + destination zone
+MOVE_TYPES = tuple(f"{src_zone.name} -> {dst_zone.name}" for src_zone in Zone for dst_zone in Zone)
+
+
+class ReplayStats:
+    """Class that accumulates the statistics of replays, partial statistics are merged into the total"""
+
+    def __init__(self) -> None:
+        """Instantiate empty statistics"""
+        self.outcomes: Counter[str] = Counter()
+
+        # Records skipped because their times do not fit the size their header declares
+        self.corrupted_count = 0
+
+        # Games, solved games and legal moves of each deal
+        self.deals: dict[int, list[int]] = {}
+
+        # Count of the legal moves of each type, with the total and the distribution of the time they took
+        self.move_counts: Counter[str] = Counter()
+        self.move_times: Counter[str] = Counter()
+        self.time_histograms: dict[str, list[int]] = {}
+
+        # Canonical keys of the tables where legal but unsolved games stopped, without any legal move left for the
+        # dead ends and with some for the abandoned positions
+        self.dead_end_positions: Counter[bytes] = Counter()
+        self.abandoned_positions: Counter[bytes] = Counter()
+
+    def add(self, deal: int, outcome: str, state: GameState, moves: memoryview, times: list[int] | None) -> None:
+        """Accounts for a replay from its outcome, its final table and its legal moves"""
+        self.outcomes[outcome] += 1
+        deal_stats = self.deals.setdefault(deal, [0, 0, 0])
+        deal_stats[0] += 1
+        deal_stats[1] += outcome == SOLVED
+        deal_stats[2] += len(moves)
+
+        for index, record in enumerate(moves):
+            src_zone, _, dst_zone, _, _ = decode_move(record)
+            move_type = MOVE_TYPES[src_zone * 3 + dst_zone]
+            self.move_counts[move_type] += 1
+
+            if times is not None:
+                self.move_times[move_type] += times[index]
+                self.get_time_histogram(move_type)[bisect.bisect_left(TIME_BUCKETS, times[index])] += 1
+
+        if outcome == UNFINISHED:
+            if len(state.legal_moves()) == 0:
+                self.dead_end_positions[state.canonical_key()] += 1
+            else:
+                self.abandoned_positions[state.canonical_key()] += 1
+
+    def merge(self, other: ReplayStats) -> None:
+        """Adds the statistics of other replays"""
+        self.outcomes.update(other.outcomes)
+        self.corrupted_count += other.corrupted_count
+        self.move_counts.update(other.move_counts)
+        self.move_times.update(other.move_times)
+        self.dead_end_positions.update(other.dead_end_positions)
+        self.abandoned_positions.update(other.abandoned_positions)
+
+        for move_type, time_histogram in other.time_histograms.items():
+            for bucket, count in enumerate(time_histogram):
+                self.get_time_histogram(move_type)[bucket] += count
+
+        for deal, (games, solved, moves) in other.deals.items():
+            deal_stats = self.deals.setdefault(deal, [0, 0, 0])
+            deal_stats[0] += games
+            deal_stats[1] += solved
+            deal_stats[2] += moves
+
+    def get_time_histogram(self, move_type: str) -> list[int]:
+        """Returns the number of moves of a type in each bucket of time"""
+        return self.time_histograms.setdefault(move_type, [0] * (len(TIME_BUCKETS) + 1))
+
+    def games_count(self) -> int:
+        """Returns the number of replays"""
+        return sum(self.outcomes.values())
+
+    def win_rate(self) -> float:
+        """Returns the fraction of replays that end with every card in the foundation cells"""
+        games_count = self.games_count()
+        return self.outcomes[SOLVED] / games_count if games_count else 0.0
+
+    def to_dict(self, top: int = 10) -> dict:
+        """Returns the statistics as plain data, with the most common dead end and abandoned positions only"""
+        return {
+            "games": self.games_count(),
+            "outcomes": dict(self.outcomes),
+            "corrupted": self.corrupted_count,
+            "win_rate": self.win_rate(),
+            "deals": {
+                deal: {"games": games, "solved": solved, "win_rate": solved / games, "moves": moves}
+                for deal, (games, solved, moves) in sorted(self.deals.items())
+            },
+            "moves": {
+                move_type: {
+                    "count": count,
+                    "mean_time": self.get_mean_time(move_type),
+                    "time_histogram": self.format_time_histogram(self.time_histograms.get(move_type, [])),
+                }
+                for move_type, count in self.move_counts.most_common()
+            },
+            "dead_end_positions": self.format_positions(self.dead_end_positions, top),
+            "abandoned_positions": self.format_positions(self.abandoned_positions, top),
+        }
+
+    def get_mean_time(self, move_type: str) -> float | None:
+        """Returns the mean time in milliseconds of the moves of a type, None if they were recorded without times"""
+        timed_count = sum(self.time_histograms.get(move_type, ()))
+        return self.move_times[move_type] / timed_count if timed_count else None
+
+    @staticmethod
+    def format_positions(positions: Counter[bytes], top: int) -> list[dict]:
+        """Returns the most common positions with their count and their table"""
+        return [{"count": count, "table": repr(GameState.from_key(key))} for key, count in positions.most_common(top)]
+
+    @staticmethod
+    def format_time_histogram(time_histogram: list[int]) -> dict[str, int]:
+        """Returns the counts of a time histogram by the name of their bucket"""
+        names = [f"<{bound}" for bound in TIME_BUCKETS] + [f">={TIME_BUCKETS[-1]}"]
+        return dict(zip(names, time_histogram))
+
+
+def iter_ranges(path: str, records_count: int) -> Iterator[tuple[int, int]]:
+    """Generates the byte ranges of a replay file that hold at most a number of records each"""
+    # An empty file cannot be mapped
+    if os.path.getsize(path) == 0:
+        return
+
+    with open(path, "rb") as file, mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as buffer:
+        start = 0
+        offset = 0
+        count = 0
+
+        # Only the headers are read to find the end of each record
+        while offset < len(buffer):
+            _, _, moves_count, times_size = read_header(buffer, offset)
+            offset += get_record_size(moves_count, times_size)
+            count += 1
+
+            if count == records_count:
+                yield (start, offset)
+                start = offset
+                count = 0
+
+        if start < offset:
+            yield (start, offset)
+
+
+def analyze_range(path: str, start: int, stop: int) -> ReplayStats:
+    """Plays the replays of a byte range of a file on their deals and returns their statistics"""
+    stats = ReplayStats()
+
+    with open(path, "rb") as file, mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as buffer:
+        with memoryview(buffer) as view:
+            offset = start
+
+            while offset < stop:
+                flags, deal, moves_count, times_size = read_header(view, offset)
+                moves_offset = offset + HEADER.size
+                offset += get_record_size(moves_count, times_size)
+
+                # A record whose times are corrupted is skipped rather than counted with wrong times
+                try:
+                    times = read_delays(view, moves_offset + 2 * moves_count, flags, moves_count, times_size)
+                except ValueError:
+                    stats.corrupted_count += 1
+                    continue
+
+                # The moves are read in place, only the ones of big endian machines are copied
+                if sys.byteorder == "big":
+                    swapped_moves = array("H")
+                    swapped_moves.frombytes(view[moves_offset : moves_offset + 2 * moves_count])
+                    swapped_moves.byteswap()
+                    moves = memoryview(swapped_moves)
+                else:
+                    moves = view[moves_offset : moves_offset + 2 * moves_count].cast("H")
+
+                # The rules of the game decide the outcome, moves after an illegal one are ignored
+                state = GameState.from_layout(deal_layout(deal))
+                outcome, legal_count = validate_moves(state, moves)
+                stats.add(deal, outcome, state, moves[:legal_count], times)
+                moves.release()
+
+    return stats
+
+
+def main() -> None:
+    """Computes the statistics of replay files with a pool of processes"""
+    parser = argparse.ArgumentParser(description="Computes the statistics of FreeCell replay files")
+    parser.add_argument("paths", nargs="+", help="replay files")
+    parser.add_argument("-w", "--workers", type=int, default=os.cpu_count(), help="number of processes")
+    parser.add_argument("--chunk-size", type=int, default=10_000, help="number of replays per task")
+    parser.add_argument("--top", type=int, default=5, help="number of dead end and abandoned positions reported")
+    parser.add_argument("--json", help="write the statistics, including every deal, to a JSON file")
+    args = parser.parse_args()
+
+    start_time = time.perf_counter()
+    stats = ReplayStats()
+
+    with ProcessPoolExecutor(args.workers) as executor:
+        futures = [
+            executor.submit(analyze_range, path, start, stop)
+            for path in args.paths
+            for start, stop in iter_ranges(path, args.chunk_size)
+        ]
+
+        for future in as_completed(futures):
+            stats.merge(future.result())
+
+    elapsed = time.perf_counter() - start_time
+    report = stats.to_dict(args.top)
+    print(f"{report["games"]} games in {len(report["deals"])} deals ({report["games"] / elapsed:.0f}/s)")
+    print(f"win rate {report["win_rate"]:.1%}, {stats.outcomes[ILLEGAL]} illegal, {report["corrupted"]} corrupted")
+
+    for move_type, move_stats in report["moves"].items():
+        mean_time = "" if move_stats["mean_time"] is None else f", {move_stats["mean_time"]:.0f} ms on average"
+        print(f"{move_type}: {move_stats["count"]} moves{mean_time}")
+
+    time_histogram = [sum(counts) for counts in zip(*stats.time_histograms.values())]
+
+    if time_histogram:
+        time_histogram = stats.format_time_histogram(time_histogram)
+        print("time per move:", ", ".join(f"{bucket} ms: {count}" for bucket, count in time_histogram.items()))
+
+    for dead_end_position in report["dead_end_positions"]:
+        print(f"\n{dead_end_position["count"]} games stuck without legal moves at\n{dead_end_position["table"]}")
+
+    for abandoned_position in report["abandoned_positions"]:
+        print(f"\n{abandoned_position["count"]} games left with legal moves at\n{abandoned_position["table"]}")
+
+    if args.json:
+        with open(args.json, "w") as file:
+            json.dump(report, file, indent=2)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,119 @@
+import hashlib
+import json
+import os
+
+import pygame
+
+from .config import Config
+
+SPRITES_PATH = "assets/sprites"
+# Number of sprites per row of the atlas
+ATLAS_COLUMNS = 16
+# Version of the packing and scaling of the sprites, atlases built by another version are built again
+ATLAS_VERSION = 2
+
+
+def atlas_sprites(config: dict) -> list[str]:
+    """Returns the sprites used by the configuration, in atlas order"""
+    sprites = [f"card{suit}{rank}.png" for suit in config["suits"] for rank in config["ranks"]]
+
+    for sprite in (config["cell_sprite"], config["foundation_cell_sprite"]):
+        if sprite not in sprites:
+            sprites.append(sprite)
+
+    return sprites
+
+
+def fingerprint(config: dict, sprites: list[str]) -> str:
+    """Returns a digest of everything the atlas is built from"""
+    digest = hashlib.sha1(f"{ATLAS_VERSION}:{config["card_width"]}x{config["card_height"]}".encode())
+
+    for sprite in sprites:
+        stat = os.stat(f"{SPRITES_PATH}/{sprite}")
+        digest.update(f"{sprite}:{stat.st_size}:{stat.st_mtime_ns}".encode())
+
+    return digest.hexdigest()
+
+
+def read_index(path: str) -> dict | None:
+    """Returns the index of the atlas or None if it does not exist"""
+    try:
+        with open(f"{path}.json") as file:
+            return json.load(file)
+    except (OSError, ValueError):
+        return None
+
+
+def is_stale(path: str, config: dict) -> bool:
+    """Checks if the atlas is missing or was built from another configuration or other assets"""
+    index = read_index(path)
+    return index is None or index["fingerprint"] != fingerprint(config, atlas_sprites(config))
+
+
+def load_sprite(sprite: str, config: dict) -> pygame.Surface:
+    """Loads a sprite resized to the card size, the atlas and the sprites missing from it are scaled the same way"""
+    image = pygame.image.load(f"{SPRITES_PATH}/{sprite}")
+    return pygame.transform.smoothscale(image, (config["card_width"], config["card_height"]))
+
+
+def build_atlas(path: str, config: dict) -> dict:
+    """Packs every sprite, resized to the card size, into a raw RGBA file and writes its index"""
+    sprites = atlas_sprites(config)
+    card_width, card_height = config["card_width"], config["card_height"]
+    width = ATLAS_COLUMNS * card_width
+    rows = -(-len(sprites) // ATLAS_COLUMNS)
+    atlas = bytearray(rows * card_height * width * 4)
+    positions = {}
+
+    # The sprites are copied row by row, blitting them onto a transparent surface would blend their pixels
+    for idx, sprite in enumerate(sprites):
+        x = (idx % ATLAS_COLUMNS) * card_width
+        y = (idx // ATLAS_COLUMNS) * card_height
+        pixels = pygame.image.tobytes(load_sprite(sprite, config), "RGBA")
+
+        for row in range(card_height):
+            start = ((y + row) * width + x) * 4
+            atlas[start : start + card_width * 4] = pixels[row * card_width * 4 : (row + 1) * card_width * 4]
+
+        positions[sprite] = (x, y)
+
+    index = {
+        "fingerprint": fingerprint(config, sprites),
+        "width": width,
+        "height": rows * card_height,
+        "card_width": card_width,
+        "card_height": card_height,
+        "sprites": positions,
+    }
+
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+
+    with open(f"{path}.rgba", "wb") as file:
+        file.write(atlas)
+
+    with open(f"{path}.json", "w") as file:
+        json.dump(index, file)
+
+    return index
+
+
+def read_atlas(path: str, config: dict) -> tuple[dict, bytes]:
+    """Returns the index and the pixels of the atlas, rebuilding the atlas when it is stale"""
+    if is_stale(path, config):
+        index = build_atlas(path, config)
+    else:
+        index = read_index(path)
+
+    with open(f"{path}.rgba", "rb") as file:
+        return (index, file.read())
+
+
+def main() -> None:
+    """Builds the texture atlas of the current configuration"""
+    config = Config.instance().default
+    index = build_atlas(config["atlas_path"], config)
+    print(f"{len(index["sprites"])} sprites packed into {config["atlas_path"]}.rgba")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,131 @@
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+from .config import Config
+
+
+def run_startup(pycache_path: str, headless: bool, transitions: int = 0) -> dict:
+    """Starts the game in a new process until its first frame and returns the measured phases"""
+    env = dict(os.environ, PYTHONPYCACHEPREFIX=pycache_path)
+
+    if headless:
+        env.setdefault("SDL_VIDEODRIVER", "dummy")
+        env.setdefault("SDL_AUDIODRIVER", "dummy")
+
+    with tempfile.TemporaryDirectory() as directory:
+        profile_path = os.path.join(directory, "profile.json")
+        start_time = time.perf_counter()
+        subprocess.run(
+            [
+                sys.executable,
+                "-m",
+                "freecell",
+                "--quit-after-first-frame",
+                "--profile-json",
+                profile_path,
+                "--transitions",
+                str(transitions),
+            ],
+            env=env,
+            check=True,
+        )
+        wall_time = time.perf_counter() - start_time
+
+        with open(profile_path) as file:
+            profile = json.load(file)
+
+    profile["wall"] = wall_time
+    return profile
+
+
+def summarize(profiles: list[dict]) -> dict:
+    """Returns the median of every phase of several runs"""
+    phases = {name for profile in profiles for name in profile["phases"]}
+    return {
+        "wall": statistics.median(profile["wall"] for profile in profiles),
+        "total": statistics.median(profile["total"] for profile in profiles),
+        "phases": {
+            name: statistics.median(profile["phases"].get(name, 0.0) for profile in profiles) for name in sorted(phases)
+        },
+    }
+
+
+def summarize_transitions(profiles: list[dict]) -> dict:
+    """Returns the median duration of a single switch to each scene, built or resumed"""
+    names = {name for profile in profiles for name in profile["phases"] if name.startswith(("change to", "resume"))}
+    return {
+        name: statistics.median(
+            profile["phases"][name] / profile["counts"][name] for profile in profiles if name in profile["phases"]
+        )
+        for name in sorted(names)
+    }
+
+
+def git_revision() -> str:
+    """Returns the current commit of the repository"""
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return "unknown"
+
+
+def main() -> None:
+    """Measures cold and warm startup times and appends them to the benchmark history"""
+    parser = argparse.ArgumentParser(description="Measures the startup time of the game")
+    parser.add_argument("-n", "--runs", type=int, default=5, help="number of warm runs")
+    parser.add_argument("--history", default="benchmarks/startup.jsonl", help="file that keeps every measurement")
+    parser.add_argument("--display", action="store_true", help="use the real display and audio devices")
+    parser.add_argument("--transitions", type=int, default=5, help="number of switches between the menu and the game")
+    args = parser.parse_args()
+
+    config = Config.instance().default
+    atlas_path = config["atlas_path"]
+
+    with tempfile.TemporaryDirectory() as pycache_path:
+        # Cold start: no compiled bytecode and no texture atlas
+        for extension in (".rgba", ".json"):
+            if os.path.exists(f"{atlas_path}{extension}"):
+                os.remove(f"{atlas_path}{extension}")
+
+        cold = run_startup(pycache_path, not args.display)
+        warm = summarize([run_startup(pycache_path, not args.display) for _ in range(args.runs)])
+        transitions = summarize_transitions([run_startup(pycache_path, not args.display, args.transitions)])
+
+    record = {
+        "date": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "revision": git_revision(),
+        "cold": summarize([cold]),
+        "warm": warm,
+        "transitions": transitions,
+    }
+
+    os.makedirs(os.path.dirname(args.history) or ".", exist_ok=True)
+
+    with open(args.history, "a") as file:
+        file.write(json.dumps(record) + "\n")
+
+    for name in ("cold", "warm"):
+        print(f"{name}: {record[name]["wall"] * 1000:.1f} ms to first frame")
+
+        for phase, duration in record[name]["phases"].items():
+            print(f"  {phase:<24}{duration * 1000:>10.1f} ms")
+
+    print("transitions:")
+
+    for phase, duration in record["transitions"].items():
+        print(f"  {phase:<24}{duration * 1000:>10.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,54 @@
+import pygame
+
+
+class DamageTracker:
+    """Class that collects the screen regions that changed since the last frame"""
+
+    _instance = None
+
+    def __init__(self) -> None:
+        """Instantiate the damage tracker"""
+        self.rects: list[pygame.Rect] = []
+        self.full = True
+
+    @classmethod
+    def instance(cls):
+        """Returns the damage tracker instance"""
+        if cls._instance is None:
+            cls._instance = cls()
+
+        return cls._instance
+
+    def add(self, rect: pygame.Rect) -> None:
+        """Marks a region of the screen to be redrawn"""
+        if not self.full:
+            self.rects.append(rect.copy())
+
+    def add_move(self, rect: pygame.Rect, previous_position: tuple[int, int]) -> None:
+        """Marks the previous and current regions of a sprite to be redrawn if it moved"""
+        if not self.full and rect.topleft != previous_position:
+            self.rects.append(pygame.Rect(previous_position, rect.size))
+            self.rects.append(rect.copy())
+
+    def invalidate(self) -> None:
+        """Marks the whole screen to be redrawn"""
+        self.full = True
+        self.rects.clear()
+
+    def collect(self) -> list[pygame.Rect]:
+        """Returns the damaged regions, with overlapping regions merged, and clears them"""
+        merged: list[pygame.Rect] = []
+
+        for rect in self.rects:
+            idx = rect.collidelist(merged)
+
+            # The union can overlap other merged regions, so it is merged again
+            while idx != -1:
+                rect = rect.union(merged.pop(idx))
+                idx = rect.collidelist(merged)
+
+            merged.append(rect)
+
+        self.rects.clear()
+        self.full = False
+        return merged
@@ -5,6 +5,7 @@ from .sprites.cell import Cell
 from .sprites.column_cell import ColumnCell
 from .sprites.foundation_cell import FoundationCell
 from .sprites.free_cell import FreeCell
+from .state import GameState, Zone
 
 
 class Dealer:
@@ -14,6 +15,9 @@ class Dealer:
         """Instantiate the dealer"""
         self.deck = deck
 
+        # Table as plain data, the card slots below are kept as its view
+        self.state = GameState()
+
         # Cells
         self.foundation_cells: list[Cell] = []
         self.free_cells: list[Cell] = []
@@ -45,48 +49,39 @@ class Dealer:
             Column_cell = ColumnCell(column)
             self.column_cells.append(Column_cell)
 
-    def deal(self) -> None:
-        """Deal the cards on the table"""
-        idx = 0
+    def reset(self) -> None:
+        """Empties the table, keeping the cell sprites for the next deal"""
+        self.state.clear()
 
-        for column in range(8):
-            for row in range(7):
-                if not (column > 3 and row == 6):
-                    card = self.deck.cards[idx]
-                    card.idx = idx
-                    card._layer = row
-                    card.shadow._layer = row - 1
-                    card.row = row
-                    card.column = column
-                    card.cell == self.column_cells[column]
-                    card.set_moving_time(-(idx + 10) / 40)
-                    card.change_state(CardState.column_cell)
-                    card.add_minimal_border()
-                    self.column_cells_slots[column].append(card)
-                    idx += 1
+        for slots in (*self.foundation_cell_slots, *self.free_cell_slots, *self.column_cells_slots):
+            slots.clear()
 
-    # Métodos de verificação
+        for cell_sprite in (*self.foundation_cells, *self.free_cells, *self.column_cells):
+            if cell_sprite.highlighted:
+                cell_sprite.remove_highlight()
 
-    def is_valid_multiple_card_drag(self, cards_list: list[Card]) -> None:
-        """Checks if the cards in the list are in descending order and with alternating suits"""
-        is_valid = True
-
-        rank = cards_list[0].rank
-        suit_color = cards_list[0].suit_color
+    def deal(self) -> None:
+        """Deal the cards on the table, row by row from left to right"""
+        for idx, card in enumerate(self.deck.cards):
+            column = idx % 8
+            row = idx // 8
+            card.idx = idx
+            card._layer = row
+            card.shadow._layer = row - 1
+            card.row = row
+            card.column = column
+            card.cell = self.column_cells[column]
+            card.set_moving_time(-(idx + 10) / 40)
+            card.change_state(CardState.column_cell)
+            card.add_minimal_border()
+            self.column_cells_slots[column].append(card)
+            self.state.add_card_column_cell(card.code, column)
 
-        for card in cards_list[1:]:
-            if self.deck.ranks.index(card.rank) == self.deck.ranks.index(rank) - 1:
-                if card.suit_color != suit_color:
-                    rank = card.rank
-                    suit_color = card.suit_color
-                else:
-                    is_valid = False
-                    break
-            else:
-                is_valid = False
-                break
+    # Métodos de verificação
 
-        return is_valid
+    def is_valid_multiple_card_drag(self, cards_list: list[Card]) -> bool:
+        """Checks if the cards in the list are in descending order and with alternating suits"""
+        return self.state.can_drag_column_cell(cards_list[0].column, cards_list[0].row)
 
     def can_drag(self, card_sprite: Card) -> tuple[bool, list[Card]]:
         """Checks if a card can be picked up"""
@@ -95,7 +90,7 @@ class Dealer:
 
         match card_sprite.state:
             case CardState.free_cell:
-                can_drag = True
+                can_drag = self.state.can_drag_free_cell(card_sprite.cell.column)
 
             case CardState.column_cell:
                 # Trata a carta do topo da célula de coluna
@@ -109,62 +104,103 @@ class Dealer:
 
     def can_drop_foundation_cell(self, card_being_dragged: Card, cell_sprite: FoundationCell) -> bool:
         """Checks if a card can be dropped into a foundation cell"""
-        can_drop = False
-
-        if len(self.foundation_cell_slots[cell_sprite.column]) == 0:
-            if card_being_dragged.rank == self.deck.ranks[0]:
-                can_drop = True
-        else:
-            top_card: Card = self.foundation_cell_slots[cell_sprite.column][-1]
-
-            if self.deck.ranks.index(top_card.rank) == self.deck.ranks.index(card_being_dragged.rank) - 1:
-                if top_card.suit == card_being_dragged.suit:
-                    can_drop = True
-
-        return can_drop
+        return self.state.can_drop_foundation_cell(card_being_dragged.code, cell_sprite.column)
 
     def can_drop_free_cell(self, cell_sprite: FreeCell) -> bool:
         """Checks if a card can be dropped into a free cell"""
-        can_drop = False
-
-        if len(self.free_cell_slots[cell_sprite.column]) == 0:
-            can_drop = True
-
-        return can_drop
+        return self.state.can_drop_free_cell(cell_sprite.column)
 
     def get_valid_cells_count(self, cell_sprite: ColumnCell) -> int:
         """Returns the number of valid cells for movement"""
-        valid_cells_count = 0
-
-        for column in range(4):
-            if len(self.free_cell_slots[column]) == 0:
-                valid_cells_count += 1
-
-        for column in range(8):
-            if len(self.column_cells_slots[column]) == 0:
-                if column != cell_sprite.column:
-                    valid_cells_count += 1
-
-        return valid_cells_count
+        return self.state.get_valid_cells_count(cell_sprite.column)
 
     def can_drop_column_cell(
         self, card_being_dragged: Card, cell_sprite: ColumnCell, other_cards_being_dragged: list[Card]
-    ):
+    ) -> bool:
         """Checks if a card can be dropped into a column cell"""
-        can_drop = False
-        valid_cells_count = self.get_valid_cells_count(cell_sprite)
-
-        if len(other_cards_being_dragged) <= valid_cells_count:
-            if len(self.column_cells_slots[cell_sprite.column]) == 0:
-                can_drop = True
-            else:
-                top_card: Card = self.column_cells_slots[cell_sprite.column][-1]
-
-                if self.deck.ranks.index(card_being_dragged.rank) == self.deck.ranks.index(top_card.rank) - 1:
-                    if card_being_dragged.suit_color != top_card.suit_color:
-                        can_drop = True
-
-        return can_drop
+        return self.state.can_drop_column_cell(
+            card_being_dragged.code,
+            cell_sprite.column,
+            len(other_cards_being_dragged) + 1,
+        )
+
+    def get_card_position(self, card_sprite: Card) -> tuple[Zone, int]:
+        """Returns the zone and the index of the cell that holds a card on the table"""
+        match card_sprite.state:
+            case CardState.free_cell:
+                return (Zone.free_cell, card_sprite.cell.column)
+            case CardState.foundation_cell:
+                return (Zone.foundation_cell, card_sprite.cell.column)
+            case _:
+                return (Zone.column_cell, card_sprite.column)
+
+    def get_cell(self, zone: Zone, index: int) -> Cell:
+        """Returns the cell sprite of a zone of the table"""
+        match zone:
+            case Zone.foundation_cell:
+                return self.foundation_cells[index]
+            case Zone.free_cell:
+                return self.free_cells[index]
+            case _:
+                return self.column_cells[index]
+
+    def get_card_slots(self, zone: Zone, index: int) -> list[Card]:
+        """Returns the cards of a cell, from the bottom to the top"""
+        match zone:
+            case Zone.foundation_cell:
+                return self.foundation_cell_slots[index]
+            case Zone.free_cell:
+                return self.free_cell_slots[index]
+            case _:
+                return self.column_cells_slots[index]
+
+    def get_drop_targets(self, source: tuple[Zone, int], cards_count: int) -> dict[Cell, Zone]:
+        """Returns the cells where the cards picked up from a cell can be dropped"""
+        drop_targets = {}
+
+        for zone, cells in (
+            (Zone.foundation_cell, self.foundation_cells),
+            (Zone.free_cell, self.free_cells),
+            (Zone.column_cell, self.column_cells),
+        ):
+            for cell_sprite in cells:
+                if self.state.can_move(*source, zone, cell_sprite.column, cards_count):
+                    drop_targets[cell_sprite] = zone
+
+        return drop_targets
+
+    def move_cards(self, cards_list: list[Card], source: tuple[Zone, int], cell_sprite: Cell, zone: Zone) -> None:
+        """Moves cards from the cell they were picked up to another cell"""
+        src_zone, src_index = source
+
+        # The cards are removed from the top of the source cell
+        for card in reversed(cards_list):
+            match src_zone:
+                case Zone.column_cell:
+                    self.remove_card_column_cell(card)
+                case Zone.free_cell:
+                    self.remove_card_free_cell(card, self.free_cells[src_index])
+                case Zone.foundation_cell:
+                    self.remove_card_foundation_cell(self.foundation_cells[src_index])
+
+        for card in cards_list:
+            match zone:
+                case Zone.foundation_cell:
+                    self.add_card_foundation_cell(card, cell_sprite)
+                case Zone.free_cell:
+                    self.add_card_free_cell(card, cell_sprite)
+                case Zone.column_cell:
+                    self.add_card_column_cell(card, cell_sprite)
+
+    def apply_move(self, src_zone: Zone, src_index: int, dst_zone: Zone, dst_index: int, count: int = 1) -> list[Card]:
+        """Moves the cards on top of a cell to another cell without checking the rules, returns the cards moved"""
+        cards_list = self.get_card_slots(src_zone, src_index)[-count:]
+        self.move_cards(cards_list, (src_zone, src_index), self.get_cell(dst_zone, dst_index), dst_zone)
+        return cards_list
+
+    def legal_moves(self) -> list[tuple[int, int, int, int, int]]:
+        """Returns every legal move of the table"""
+        return self.state.legal_moves()
 
     # Métodos de adição
 
@@ -174,6 +210,7 @@ class Dealer:
         card_being_dragged._layer = layer
         card_being_dragged.cell = cell_sprite
         self.foundation_cell_slots[cell_sprite.column].append(card_being_dragged)
+        self.state.add_card_foundation_cell(card_being_dragged.code, cell_sprite.column)
 
     def add_card_free_cell(self, card_being_dragged: Card, cell_sprite: FreeCell) -> None:
         """Add a card to a free cell"""
@@ -181,8 +218,9 @@ class Dealer:
         card_being_dragged._layer = layer
         card_being_dragged.cell = cell_sprite
         self.free_cell_slots[cell_sprite.column].append(card_being_dragged)
+        self.state.add_card_free_cell(card_being_dragged.code, cell_sprite.column)
 
-    def add_card_column_cell(self, card_being_dragged: Card, cell_sprite: Card) -> None:
+    def add_card_column_cell(self, card_being_dragged: Card, cell_sprite: ColumnCell) -> None:
         """Add a card to a column cell"""
         column_size = len(self.column_cells_slots[cell_sprite.column])
         card_being_dragged.row = column_size
@@ -191,17 +229,21 @@ class Dealer:
         card_being_dragged.cell = cell_sprite
         card_being_dragged.column = cell_sprite.column
         self.column_cells_slots[cell_sprite.column].append(card_being_dragged)
+        self.state.add_card_column_cell(card_being_dragged.code, cell_sprite.column)
 
     # Métodos de remoção
 
-    def remove_card_foundation_cell(self) -> None:
+    def remove_card_foundation_cell(self, cell_sprite: FoundationCell) -> Card:
         """Remove a card from a foundation cell"""
-        pass
+        self.state.remove_card_foundation_cell(cell_sprite.column)
+        return self.foundation_cell_slots[cell_sprite.column].pop()
 
     def remove_card_free_cell(self, card_being_dragged: Card, cell_sprite: FreeCell) -> None:
         """Remove a card from a free cell"""
         self.free_cell_slots[cell_sprite.column].remove(card_being_dragged)
+        self.state.remove_card_free_cell(cell_sprite.column)
 
     def remove_card_column_cell(self, card_being_dragged: Card) -> None:
-        """Remove a card from a column cell"""
+        """Remove a card from the top of a column cell"""
         self.column_cells_slots[card_being_dragged.column].remove(card_being_dragged)
+        self.state.remove_card_column_cell(card_being_dragged.column)
@@ -0,0 +1,48 @@
+from collections.abc import Iterator
+
+from .state import CARDS_COUNT, COLUMN_CELLS_COUNT, RANKS_COUNT
+
+# Deals 1 to 2^31 - 1 reproduce the classic Microsoft FreeCell layouts. Larger
+# numbers, up to 2^64 - 1, use the same card selection driven by a 64-bit LCG
+MAX_CLASSIC_DEAL = 0x7FFFFFFF
+MAX_DEAL = 0xFFFFFFFFFFFFFFFF
+
+# Microsoft orders the deck by rank first (AC AD AH AS 2C ...)
+_MS_TO_CODE = tuple((card % 4) * RANKS_COUNT + card // 4 for card in range(CARDS_COUNT))
+
+
+def deal_cards(number: int) -> list[int]:
+    """Returns the cards of a numbered deal in dealing order"""
+    if not 1 <= number <= MAX_DEAL:
+        raise ValueError(f"Deal number must be between 1 and {MAX_DEAL}: {number}")
+
+    deck = list(range(CARDS_COUNT))
+    cards = []
+    seed = number
+
+    if number <= MAX_CLASSIC_DEAL:
+        for left in range(CARDS_COUNT, 0, -1):
+            seed = (seed * 214013 + 2531011) & 0x7FFFFFFF
+            idx = (seed >> 16) % left
+            cards.append(_MS_TO_CODE[deck[idx]])
+            deck[idx] = deck[left - 1]
+    else:
+        for left in range(CARDS_COUNT, 0, -1):
+            seed = (seed * 6364136223846793005 + 1442695040888963407) & 0xFFFFFFFFFFFFFFFF
+            idx = (seed >> 33) % left
+            cards.append(_MS_TO_CODE[deck[idx]])
+            deck[idx] = deck[left - 1]
+
+    return cards
+
+
+def deal_layout(number: int) -> list[list[int]]:
+    """Returns the column cells of a numbered deal, dealt row by row from left to right"""
+    cards = deal_cards(number)
+    return [cards[column::COLUMN_CELLS_COUNT] for column in range(COLUMN_CELLS_COUNT)]
+
+
+def iter_layouts(start: int, stop: int) -> Iterator[tuple[int, list[list[int]]]]:
+    """Generates the column cells of a range of numbered deals"""
+    for number in range(start, stop):
+        yield (number, deal_layout(number))
@@ -1,7 +1,7 @@
-from random import shuffle
-
 from .config import Config
+from .deals import deal_cards
 from .sprites.card import Card
+from .state import card_code
 
 
 class Deck:
@@ -15,11 +15,17 @@ class Deck:
         self.ranks: list[str] = self.config["ranks"]
         self.cards: list[Card] = []
 
-        for suit in self.suits:
-            for rank in self.ranks:
-                card = Card(suit, rank)
+        for suit_idx, suit in enumerate(self.suits):
+            for rank_idx, rank in enumerate(self.ranks):
+                card = Card(suit, rank, card_code(suit_idx, rank_idx))
                 self.cards.append(card)
 
-    def shuffle(self) -> None:
-        """Shuffle the cards"""
-        shuffle(self.cards)
+    def reset(self) -> None:
+        """Puts every card back on the dealer"""
+        for card in self.cards:
+            card.reset()
+
+    def arrange(self, deal_number: int) -> None:
+        """Puts the cards in the dealing order of a numbered deal"""
+        cards_by_code = {card.code: card for card in self.cards}
+        self.cards = [cards_by_code[code] for code in deal_cards(deal_number)]
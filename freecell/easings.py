@@ -1,6 +1,40 @@
-import math
+from collections.abc import Callable
+
+# The easings map the progress of an animation between 0 and 1 to the fraction of the distance covered,
+# they only use arithmetic so they can also be applied element-wise to arrays
+
+
+def linear(x: float) -> float:
+    """Constant speed animation"""
+    return x
+
+
+def smoothstep(x: float) -> float:
+    """Gradual acceleration and deceleration animation"""
+    return (3 - 2 * x) * x * x
+
+
+def ease_out_cubic(x: float) -> float:
+    """Fast start and gentle deceleration animation"""
+    return 1 - (1 - x) ** 3
 
 
 def ease_out_quart(x: float) -> float:
     """Sharp acceleration and gradual deceleration animation"""
-    return 1 - math.pow(1 - x, 5)
+    return 1 - (1 - x) ** 5
+
+
+EASINGS: dict[str, Callable[[float], float]] = {
+    "linear": linear,
+    "smoothstep": smoothstep,
+    "ease_out_cubic": ease_out_cubic,
+    "ease_out_quart": ease_out_quart,
+}
+
+
+def get_easing(name: str) -> Callable[[float], float]:
+    """Returns an easing from its name in the configuration"""
+    if name not in EASINGS:
+        raise ValueError(f"Easing must be one of {", ".join(EASINGS)}: {name}")
+
+    return EASINGS[name]
@@ -1,7 +1,12 @@
+import itertools
+from collections.abc import Iterator
+
 import pygame
 
 from .config import Config
-from .scenes.main_scene import MainScene
+from .damage import DamageTracker
+from .preloader import Preloader
+from .profiler import StartupProfiler
 from .scenes.menu_scene import MenuScene
 from .scenes.scene import Scene
 
@@ -9,34 +14,71 @@ from .scenes.scene import Scene
 class Game:
     """Class that controls game execution"""
 
-    def __init__(self) -> None:
+    def __init__(self, profiler: StartupProfiler | None = None) -> None:
         """Instantiate the game"""
-        self.config = Config.instance().default
+        self.profiler = profiler if profiler is not None else StartupProfiler()
+
+        with self.profiler.phase("config"):
+            self.config = Config.instance().default
+
+        with self.profiler.phase("pygame init"):
+            pygame.mixer.init()
+            pygame.init()
 
-        pygame.mixer.init()
-        pygame.init()
+        with self.profiler.phase("display init"):
+            icon = pygame.image.load(f"assets/icons/{self.config["icon"]}")
+            pygame.display.set_icon(icon)
+            pygame.display.set_caption(self.config["screen_title"])
 
-        icon = pygame.image.load(f"assets/icons/{self.config["icon"]}")
-        pygame.display.set_icon(icon)
-        pygame.display.set_caption(self.config["screen_title"])
+            self.screen = pygame.display.set_mode(
+                size=(self.config["screen_width"], self.config["screen_height"]),
+            )
 
-        self.screen = pygame.display.set_mode(
-            size=(self.config["screen_width"], self.config["screen_height"]),
-        )
         self.clock = pygame.time.Clock()
+        self.damage = DamageTracker.instance()
         self.is_running = True
         self.fps = self.config["fps"]
-        self.scene: Scene = MenuScene(self)
+        self.waited_events: list[pygame.event.Event] = []
+        self.first_frame_drawn = False
+
+        with self.profiler.phase("menu scene"):
+            self.scene: Scene = MenuScene(self)
+
+        # Scenes are built once and suspended while another scene is shown
+        self.scenes: dict[str, Scene] = {"MenuScene": self.scene}
+        self.started_scenes = {"MenuScene"}
+
+        # Scenes being built one step per frame, with the rest of their preparation
+        self.preparations: dict[str, tuple[Scene, Iterator[None]]] = {}
+
+        # The assets of the main scene are loaded while the menu is shown
+        self.preloader = Preloader()
 
     # Default methods
 
     def ready(self) -> None:
         """Prepare the game for execution"""
-        self.scene.ready()
+        with self.profiler.phase("menu ready"):
+            self.scene.ready()
+
+        self.preloader.start()
+
+    def _wait_events(self) -> None:
+        """Sleeps until an input event arrives or the idle timeout expires"""
+        event = pygame.event.wait(self.config["idle_timeout"])
+
+        if event.type != pygame.NOEVENT:
+            self.waited_events.append(event)
+
+        # The time spent waiting does not count as animation time
+        self.clock.tick()
 
     def _process_events(self) -> None:
         """Processes input events"""
-        for event in pygame.event.get():
+        events = self.waited_events + pygame.event.get()
+        self.waited_events = []
+
+        for event in events:
             self.scene.process_events(event)
 
             if event.type == pygame.QUIT:
@@ -44,32 +86,125 @@ class Game:
 
     def _process_update(self) -> None:
         """Processes the sprite update"""
-        dt = self.clock.tick(self.config["fps"]) / 1000
+        # A long frame, such as a scene being loaded, is slowed down instead of skipping the animations
+        dt = min(self.clock.tick(self.config["fps"]) / 1000, self.config["max_frame_time"])
         self.scene.process_update(dt)
 
+    def _draw_background(self, background: pygame.Surface | None) -> None:
+        """Draws the static layer of the scene, limited to the clipping region of the screen"""
+        if background is None:
+            self.screen.fill(self.config["screen_color"])
+        else:
+            self.screen.blit(background, (0, 0))
+
     def _process_draw(self) -> None:
         """Renders game frames"""
-        self.screen.fill(self.config["screen_color"])
-        self.scene.process_draw()
-        pygame.display.flip()
+        background = self.scene.get_background()
+
+        if self.config["render_mode"] == "dirty" and not self.damage.full:
+            rects = self.damage.collect()
+
+            # Only the regions that changed are redrawn and sent to the display
+            for rect in rects:
+                self.screen.set_clip(rect)
+                self._draw_background(background)
+                self.scene.process_draw()
+
+            self.screen.set_clip(None)
+
+            if rects:
+                pygame.display.update(rects)
+        else:
+            self._draw_background(background)
+            self.scene.process_draw()
+            pygame.display.flip()
+
+            if self.config["render_mode"] == "dirty":
+                self.damage.collect()
+
+    def _process_preloading(self) -> None:
+        """Hands the preloaded assets to the game and prepares the main scene once they are all loaded"""
+        self.preloader.process()
+
+        # A step of the preparation per frame keeps the menu responsive
+        if self.preloader.is_finished():
+            self.prepare_scene("MainScene", 1)
 
     def process(self) -> None:
-        """Processes each frame of the game"""
+        """Processes each frame of the game, sleeping between events while the scene is not animating"""
+        is_preloading = "MainScene" not in self.scenes
+
+        if is_preloading:
+            self._process_preloading()
+
+        if self.first_frame_drawn and not is_preloading and not self.scene.is_animating():
+            self._wait_events()
+
         self._process_events()
         self._process_update()
         self._process_draw()
+        self.first_frame_drawn = True
 
     def quit(self) -> None:
         """Ends the game execution"""
+        # Every built scene is told, whether the game ends from the menu or by closing the window
+        for scene in self.scenes.values():
+            scene.quit()
+
         pygame.quit()
 
     # Local methods
 
-    def change_scene(self, scene: str) -> None:
-        """Changes the current game scene"""
+    def build_scene(self, scene: str) -> Scene:
+        """Instantiates a scene from its name"""
         if scene == "MainScene":
-            self.scene = MainScene(self)
-        elif scene == "MenuScene":
-            self.scene = MenuScene(self)
+            # The main scene and its sprites are only imported when the game starts
+            from .scenes.main_scene import MainScene
 
-        self.scene.ready()
+            return MainScene(self)
+
+        return MenuScene(self)
+
+    def prepare_scene(self, scene: str, steps: int | None = None) -> None:
+        """Builds a scene ahead of time and keeps it until it is shown, only some steps of it if a number is given"""
+        if scene in self.scenes:
+            return
+
+        with self.profiler.phase(f"prepare {scene}"):
+            if scene not in self.preparations:
+                built_scene = self.build_scene(scene)
+                self.preparations[scene] = (built_scene, built_scene.prepare())
+
+                # Building the scene is a step of its own
+                if steps is not None:
+                    return
+
+            built_scene, preparation = self.preparations[scene]
+
+            try:
+                for _ in range(steps) if steps is not None else itertools.count():
+                    next(preparation)
+            except StopIteration:
+                del self.preparations[scene]
+                self.scenes[scene] = built_scene
+
+    def change_scene(self, scene: str) -> None:
+        """Changes the current game scene, resuming it if it was already shown"""
+        self.scene.suspend()
+
+        if scene in self.started_scenes:
+            with self.profiler.phase(f"resume {scene}"):
+                self.scene = self.scenes[scene]
+                self.scene.resume()
+        else:
+            with self.profiler.phase(f"change to {scene}"):
+                # Assets still loading are waited for rather than loaded a second time
+                self.preloader.finish()
+                self.prepare_scene(scene)
+                self.scene = self.scenes[scene]
+                self.started_scenes.add(scene)
+                self.scene.ready()
+
+        # The first frame of the scene is drawn without waiting for input
+        self.first_frame_drawn = False
+        self.damage.invalidate()
@@ -0,0 +1,141 @@
+from array import array
+
+# A move fits in 16 bits: source zone and index, destination zone and index, then the number of cards
+_ZONE_BITS = 2
+_INDEX_BITS = 3
+_COUNT_BITS = 4
+_CELL_BITS = _ZONE_BITS + _INDEX_BITS
+
+# Node of the journal before the first move
+ROOT = -1
+
+
+def encode_move(src_zone: int, src_index: int, dst_zone: int, dst_index: int, count: int = 1) -> int:
+    """Packs a move into a 16 bits integer"""
+    source = (src_zone << _INDEX_BITS) | src_index
+    destination = (dst_zone << _INDEX_BITS) | dst_index
+    return (((source << _CELL_BITS) | destination) << _COUNT_BITS) | count
+
+
+def decode_move(record: int) -> tuple[int, int, int, int, int]:
+    """Unpacks a move from its 16 bits integer"""
+    count = record & ((1 << _COUNT_BITS) - 1)
+    record >>= _COUNT_BITS
+    destination = record & ((1 << _CELL_BITS) - 1)
+    source = record >> _CELL_BITS
+    index_mask = (1 << _INDEX_BITS) - 1
+    return (source >> _INDEX_BITS, source & index_mask, destination >> _INDEX_BITS, destination & index_mask, count)
+
+
+def inverse_move(move: tuple[int, int, int, int, int]) -> tuple[int, int, int, int, int]:
+    """Returns the move that puts the cards of a move back where they were"""
+    src_zone, src_index, dst_zone, dst_index, count = move
+    return (dst_zone, dst_index, src_zone, src_index, count)
+
+
+class MoveJournal:
+    """Class that records the moves of a game as a tree, so undone branches are kept when a new move is made"""
+
+    def __init__(self) -> None:
+        """Instantiate an empty journal"""
+        # Node i holds a move, the time in milliseconds it was made, the node it follows and the child that redo goes to
+        self.moves = array("H")
+        self.times = array("I")
+        self.parents = array("i")
+        self.last_children = array("i")
+        self.root_last_child = ROOT
+        self.current = ROOT
+
+    def __len__(self) -> int:
+        """Returns the number of moves recorded in every branch"""
+        return len(self.moves)
+
+    def clear(self) -> None:
+        """Forgets every move, keeping the allocated memory"""
+        del self.moves[:]
+        del self.times[:]
+        del self.parents[:]
+        del self.last_children[:]
+        self.root_last_child = ROOT
+        self.current = ROOT
+
+    def get_last_child(self, node: int) -> int:
+        """Returns the node that follows a node when a move is redone"""
+        return self.root_last_child if node == ROOT else self.last_children[node]
+
+    def set_last_child(self, node: int, child: int) -> None:
+        """Sets the node that follows a node when a move is redone"""
+        if node == ROOT:
+            self.root_last_child = child
+        else:
+            self.last_children[node] = child
+
+    def record(self, move: tuple[int, int, int, int, int], time: int = 0) -> None:
+        """Adds a move made at a time in milliseconds, starting a new branch if moves were undone"""
+        record = encode_move(*move)
+        child = self.get_last_child(self.current)
+
+        # Making again the move that was undone follows the existing branch
+        if child != ROOT and self.moves[child] == record:
+            self.times[child] = time
+            self.current = child
+            return
+
+        self.moves.append(record)
+        self.times.append(time)
+        self.parents.append(self.current)
+        self.last_children.append(ROOT)
+        self.set_last_child(self.current, len(self.moves) - 1)
+        self.current = len(self.moves) - 1
+
+    def can_undo(self) -> bool:
+        """Checks if there is a move to undo"""
+        return self.current != ROOT
+
+    def can_redo(self) -> bool:
+        """Checks if there is a move to redo"""
+        return self.get_last_child(self.current) != ROOT
+
+    def undo(self) -> tuple[int, int, int, int, int] | None:
+        """Steps back one move and returns the move that reverses it, or None at the start of the game"""
+        if not self.can_undo():
+            return None
+
+        move = decode_move(self.moves[self.current])
+        self.current = self.parents[self.current]
+        return inverse_move(move)
+
+    def redo(self) -> tuple[int, int, int, int, int] | None:
+        """Steps forward one move in the last branch visited and returns it, or None at its end"""
+        if not self.can_redo():
+            return None
+
+        self.current = self.get_last_child(self.current)
+        return decode_move(self.moves[self.current])
+
+    def get_branches(self, node: int = ROOT) -> list[int]:
+        """Returns the nodes that follow a node, one for each branch"""
+        return [child for child, parent in enumerate(self.parents) if parent == node]
+
+    def switch_branch(self, child: int) -> None:
+        """Makes redo follow a branch that starts at the current node"""
+        if self.parents[child] != self.current:
+            raise ValueError(f"Branch must start at the current move: {child}")
+
+        self.set_last_child(self.current, child)
+
+    def get_path(self) -> list[int]:
+        """Returns the nodes from the start of the game to the current one"""
+        path = []
+        node = self.current
+
+        while node != ROOT:
+            path.append(node)
+            node = self.parents[node]
+
+        path.reverse()
+        return path
+
+    def get_moves(self) -> list[tuple[int, int, int, int, int]]:
+        """Returns the moves from the start of the game to the current one"""
+        return [decode_move(self.moves[node]) for node in self.get_path()]
@@ -0,0 +1,85 @@
+from .config import Config
+from .state import COLUMN_CELLS_COUNT, FOUNDATION_CELLS_COUNT, FREE_CELLS_COUNT, Zone
+
+
+def _clamp(value: int, maximum: int) -> int:
+    """Limits a value between 0 and maximum"""
+    return max(0, min(value, maximum))
+
+
+class Layout:
+    """Class that maps screen points to the cells of the table from the configuration"""
+
+    def __init__(self) -> None:
+        """Instantiate the table layout"""
+        self.config = Config.instance().default
+        self.card_width = self.config["card_width"]
+        self.card_height = self.config["card_height"]
+        self.column_step = self.card_width + self.config["card_margin_x"]
+        self.cell_step = self.card_width + self.config["cell_margin_x"]
+        self.row_step = round(self.card_height * 0.235)
+        # Foundation cells are placed as if they followed four more cells
+        self.foundation_cell_offset_x = 4 * self.cell_step + self.config["foundation_cell_offset_x"]
+
+    # Positions
+
+    def get_cell_position(self, zone: Zone, index: int, row: int = 0) -> tuple[int, int]:
+        """Returns the top left corner of a card placed in a cell"""
+        match zone:
+            case Zone.foundation_cell:
+                return (index * self.cell_step + self.foundation_cell_offset_x, self.config["cell_offset_y"])
+            case Zone.free_cell:
+                return (index * self.cell_step + self.config["free_cell_offset_x"], self.config["cell_offset_y"])
+            case _:
+                return (
+                    index * self.column_step + self.config["card_offset_x"],
+                    row * self.row_step + self.config["card_offset_y"],
+                )
+
+    # Hit testing
+
+    def hit(self, x: int, y: int) -> tuple[Zone, int, int] | None:
+        """Returns the zone, the cell index and the row under a point, or None between cells"""
+        cell_offset_y = self.config["cell_offset_y"]
+
+        if cell_offset_y <= y < cell_offset_y + self.card_height:
+            index, offset_x = divmod(x - self.config["free_cell_offset_x"], self.cell_step)
+
+            if 0 <= index < FREE_CELLS_COUNT and offset_x < self.card_width:
+                return (Zone.free_cell, index, 0)
+
+            index, offset_x = divmod(x - self.foundation_cell_offset_x, self.cell_step)
+
+            if 0 <= index < FOUNDATION_CELLS_COUNT and offset_x < self.card_width:
+                return (Zone.foundation_cell, index, 0)
+
+        elif y >= self.config["card_offset_y"]:
+            index, offset_x = divmod(x - self.config["card_offset_x"], self.column_step)
+
+            if 0 <= index < COLUMN_CELLS_COUNT and offset_x < self.card_width:
+                return (Zone.column_cell, index, (y - self.config["card_offset_y"]) // self.row_step)
+
+        return None
+
+    def get_candidate_cells(self, x: int, y: int) -> list[tuple[Zone, int]]:
+        """Returns the cells of the top row and the column whose centers are the closest to a point"""
+        half_width = self.card_width // 2
+        free_cell_index = _clamp(
+            round((x - half_width - self.config["free_cell_offset_x"]) / self.cell_step), FREE_CELLS_COUNT - 1
+        )
+        foundation_cell_index = _clamp(
+            round((x - half_width - self.foundation_cell_offset_x) / self.cell_step), FOUNDATION_CELLS_COUNT - 1
+        )
+        column = _clamp(
+            round((x - half_width - self.config["card_offset_x"]) / self.column_step), COLUMN_CELLS_COUNT - 1
+        )
+
+        free_cell_x = self.get_cell_position(Zone.free_cell, free_cell_index)[0]
+        foundation_cell_x = self.get_cell_position(Zone.foundation_cell, foundation_cell_index)[0]
+
+        if abs(x - half_width - free_cell_x) <= abs(x - half_width - foundation_cell_x):
+            top_cell = (Zone.free_cell, free_cell_index)
+        else:
+            top_cell = (Zone.foundation_cell, foundation_cell_index)
+
+        return [top_cell, (Zone.column_cell, column)]
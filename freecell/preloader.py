@@ -0,0 +1,97 @@
+import importlib
+import queue
+import threading
+
+import pygame
+
+from . import atlas
+from .config import Config
+from .sound_bank import SoundBank
+from .textures import TextureCache
+
+
+class Preloader:
+    """Class that loads the assets of the game on a worker thread while the menu is shown"""
+
+    def __init__(self) -> None:
+        """Instantiate the preloader"""
+        self.config = Config.instance().default
+        self.tasks: list[tuple[str, str]] = [
+            ("module", "freecell.scenes.main_scene"),
+            ("atlas", self.config["atlas_path"]),
+        ]
+
+        for sound in (
+            self.config["loading_sound"],
+            self.config["start_sound"],
+            self.config["card_drag_sound"],
+            self.config["card_drop_sound"],
+        ):
+            self.tasks.append(("sound", sound))
+
+        self.installed_count = 0
+        self._results: queue.SimpleQueue = queue.SimpleQueue()
+        self._thread: threading.Thread | None = None
+
+    def start(self) -> None:
+        """Starts loading the assets in the background"""
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._run, name="preloader", daemon=True)
+            self._thread.start()
+
+    def progress(self) -> float:
+        """Returns the fraction of the assets already handed to the game"""
+        return self.installed_count / len(self.tasks)
+
+    def is_finished(self) -> bool:
+        """Checks if every asset was handed to the game"""
+        return self.installed_count == len(self.tasks)
+
+    def process(self) -> None:
+        """Hands the assets loaded so far to the game, it must be called from the main thread"""
+        while True:
+            try:
+                kind, name, value = self._results.get_nowait()
+            except queue.Empty:
+                return
+
+            self._install(kind, name, value)
+
+    def finish(self) -> None:
+        """Waits for the remaining assets and hands them to the game"""
+        self.start()
+        self._thread.join()
+        self.process()
+
+    # Local methods
+
+    def _run(self) -> None:
+        """Loads every asset, the errors are raised again on the main thread"""
+        for kind, name in self.tasks:
+            try:
+                self._results.put((kind, name, self._load(kind, name)))
+            except Exception as error:
+                self._results.put(("error", name, error))
+
+    def _load(self, kind: str, name: str) -> object:
+        """Reads and decodes an asset, without touching the display"""
+        match kind:
+            case "module":
+                return importlib.import_module(name)
+            case "atlas":
+                return atlas.read_atlas(name, self.config)
+            case "sound":
+                return pygame.mixer.Sound(f"assets/sounds/{name}")
+
+    def _install(self, kind: str, name: str, value: object) -> None:
+        """Shares a loaded asset with the caches of the game"""
+        match kind:
+            case "atlas":
+                # Surfaces are converted to the display format on the main thread
+                TextureCache.instance().install_atlas(*value)
+            case "sound":
+                SoundBank.instance().add(name, value)
+            case "error":
+                raise value
+
+        self.installed_count += 1
@@ -0,0 +1,45 @@
+import json
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+
+
+class StartupProfiler:
+    """Class that measures the duration of the phases of the game startup"""
+
+    def __init__(self) -> None:
+        """Instantiate the profiler, the startup is measured from this moment"""
+        self.start_time = time.perf_counter()
+        self.phases: list[tuple[str, float]] = []
+
+    @contextmanager
+    def phase(self, name: str) -> Iterator[None]:
+        """Measures the duration of the code inside the context"""
+        start_time = time.perf_counter()
+
+        try:
+            yield
+        finally:
+            self.phases.append((name, time.perf_counter() - start_time))
+
+    def elapsed(self) -> float:
+        """Returns the time since the profiler was instantiated"""
+        return time.perf_counter() - self.start_time
+
+    def report(self) -> str:
+        """Returns the duration of every phase as a table"""
+        lines = [f"{name:<24}{duration * 1000:>10.1f} ms" for name, duration in self.phases]
+        lines.append(f"{"total":<24}{self.elapsed() * 1000:>10.1f} ms")
+        return "\n".join(lines)
+
+    def dump(self, path: str) -> None:
+        """Writes the total duration and the number of runs of every phase to a JSON file"""
+        phases: dict[str, float] = {}
+        counts: dict[str, int] = {}
+
+        for name, duration in self.phases:
+            phases[name] = phases.get(name, 0.0) + duration
+            counts[name] = counts.get(name, 0) + 1
+
+        with open(path, "w") as file:
+            json.dump({"phases": phases, "counts": counts, "total": self.elapsed()}, file)
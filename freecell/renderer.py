@@ -0,0 +1,149 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import pygame
+
+from .config import Config
+from .layout import Layout
+from .sprites.card_state import CardState
+from .state import COLUMN_CELLS_COUNT, FOUNDATION_CELLS_COUNT, FREE_CELLS_COUNT, Zone
+
+if TYPE_CHECKING:
+    from .dealer import Dealer
+    from .sprites.card import Card
+    from .tweens import TweenScheduler
+
+# Every cell of the table as (zone, index)
+CELLS = tuple(
+    (zone, index)
+    for zone, count in (
+        (Zone.foundation_cell, FOUNDATION_CELLS_COUNT),
+        (Zone.free_cell, FREE_CELLS_COUNT),
+        (Zone.column_cell, COLUMN_CELLS_COUNT),
+    )
+    for index in range(count)
+)
+
+
+class TableRenderer:
+    """Class that draws the cards of the table, keeping the settled cards of each cell as a single surface"""
+
+    def __init__(self, dealer: Dealer, tweens: TweenScheduler, all_sprites: pygame.sprite.LayeredUpdates) -> None:
+        """Instantiate the table renderer"""
+        self.config = Config.instance().default
+        self.dealer = dealer
+        self.tweens = tweens
+        self.all_sprites = all_sprites
+        self.layout = Layout()
+        self.shadow_offset = self.config["shadow_offset"]
+
+        # Part of a covered card left visible by the next card of the column, including its rounded corners
+        self.strip_height = self.layout.row_step + round(self.layout.card_height * 0.04)
+
+        # Surface and position of each cell over the background it covers, None while the cell is empty
+        self.cell_surfaces: dict[tuple[Zone, int], tuple[pygame.Surface, tuple[int, int]] | None] = dict.fromkeys(
+            CELLS
+        )
+        self.dirty_cells = set(CELLS)
+
+    # Cache
+
+    def invalidate_cell(self, zone: Zone, index: int) -> None:
+        """Discards the surface of a cell, it is built again on the next frame"""
+        self.dirty_cells.add((zone, index))
+
+    def invalidate(self) -> None:
+        """Discards the surfaces of every cell"""
+        self.dirty_cells.update(CELLS)
+
+    def invalidate_area(self, rect: pygame.Rect | None = None) -> None:
+        """Discards the surfaces of the cells over a region of the background that was drawn again"""
+        if rect is None:
+            self.invalidate()
+            return
+
+        for zone, index in CELLS:
+            if self.get_cell_area(zone, index).colliderect(rect):
+                self.dirty_cells.add((zone, index))
+
+    def release(self) -> None:
+        """Frees the surfaces of every cell, they are built again on the next frame"""
+        self.cell_surfaces = dict.fromkeys(CELLS)
+        self.invalidate()
+
+    def is_settled(self, card: Card) -> bool:
+        """Checks if a card rests in its cell"""
+        return card.state != CardState.drag and card not in self.tweens.slots
+
+    def get_cell_area(self, zone: Zone, index: int) -> pygame.Rect:
+        """Returns the region of the screen the cards of a cell can cover"""
+        x, y = self.layout.get_cell_position(zone, index)
+        width = self.layout.card_width + self.shadow_offset
+
+        if zone == Zone.column_cell:
+            return pygame.Rect(x, y, width, self.config["screen_height"] - y)
+
+        return pygame.Rect(x, y, width, self.layout.card_height + self.shadow_offset)
+
+    def build_cell(
+        self, zone: Zone, index: int, background: pygame.Surface | None
+    ) -> tuple[pygame.Surface, tuple[int, int]] | None:
+        """Draws the settled cards of a cell over their shadows, only the visible strip of the covered column cards"""
+        cards = []
+
+        for card in self.dealer.get_card_slots(zone, index):
+            if not self.is_settled(card):
+                break
+
+            cards.append(card)
+
+        if len(cards) == 0:
+            return None
+
+        # The cards of a free or foundation cell are piled at the same position
+        row_step = self.layout.row_step if zone == Zone.column_cell else 0
+        width = self.layout.card_width + self.shadow_offset
+        height = (len(cards) - 1) * row_step + self.layout.card_height + self.shadow_offset
+        position = self.layout.get_cell_position(zone, index)
+        strip = pygame.Rect(0, 0, width, self.strip_height) if zone == Zone.column_cell else None
+
+        # The cards are blended over the background they cover, as the screen would blend them, so the result
+        # is the same as drawing each sprite: blending over a transparent surface first would round differently
+        if background is None:
+            surface = pygame.Surface((width, height)).convert()
+            surface.fill(self.config["screen_color"])
+        else:
+            area = pygame.Rect(position, (width, height)).clip(background.get_rect())
+            surface = background.subsurface(area).copy()
+
+        for row, card in enumerate(cards):
+            area = strip if row < len(cards) - 1 else None
+            y = row * row_step
+            surface.blit(card.shadow.image, (self.shadow_offset, y + self.shadow_offset))
+            surface.blit(card.image, (0, y), area)
+
+        return (surface, position)
+
+    # Drawing
+
+    def draw(self, screen: pygame.Surface, dragged_cards: list[Card], background: pygame.Surface | None) -> None:
+        """Draws the settled cards from their cached surfaces, then the moving cards above them"""
+        for zone, index in self.dirty_cells:
+            self.cell_surfaces[(zone, index)] = self.build_cell(zone, index, background)
+
+        self.dirty_cells.clear()
+        blits = [cell_surface for cell_surface in self.cell_surfaces.values() if cell_surface is not None]
+        moving_sprites = set()
+
+        for card in (*self.tweens.slots, *dragged_cards):
+            moving_sprites.add(card)
+            moving_sprites.add(card.shadow)
+
+        # The moving cards and their shadows keep the order the sprite group draws them in
+        if moving_sprites:
+            for sprite in self.all_sprites.sprites():
+                if sprite in moving_sprites:
+                    blits.append((sprite.image, sprite.rect))
+
+        screen.blits(blits, doreturn=False)
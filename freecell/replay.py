@@ -0,0 +1,250 @@
+from __future__ import annotations
+
+import argparse
+import os
+import struct
+import sys
+import time
+from array import array
+from collections.abc import Iterator
+
+from .deals import deal_layout
+from .journal import MoveJournal, decode_move
+from .state import GameState
+
+# A replay file is a sequence of records that can be concatenated. Each record is a header (magic, version,
+# flags, deal number, number of moves, size of the timestamps) followed by the moves, 16 bits each in little
+# endian order, then the time elapsed before each move in milliseconds as variable length integers
+MAGIC = b"FCRP"
+VERSION = 1
+HEADER = struct.Struct("<4sBBQII")
+
+# Flags of a record
+HAS_TIMES = 0x01
+
+# Outcomes of the validation of a replay
+SOLVED = "solved"
+UNFINISHED = "unfinished"
+ILLEGAL = "illegal"
+
+
+def write_varint(buffer: bytearray, value: int) -> None:
+    """Appends an unsigned integer to a buffer, 7 bits per byte"""
+    while value >= 0x80:
+        buffer.append((value & 0x7F) | 0x80)
+        value >>= 7
+
+    buffer.append(value)
+
+
+def read_varint(buffer: bytes | memoryview, offset: int, end: int) -> tuple[int, int]:
+    """Reads an unsigned integer stored before an end offset and returns it with the offset that follows it"""
+    value = 0
+    shift = 0
+
+    while True:
+        if offset >= end:
+            raise ValueError(f"Replay times overrun their size at offset {offset}")
+
+        byte = buffer[offset]
+        offset += 1
+        value |= (byte & 0x7F) << shift
+
+        if byte < 0x80:
+            return (value, offset)
+
+        shift += 7
+
+
+def read_header(buffer: bytes | memoryview, offset: int = 0) -> tuple[int, int, int, int]:
+    """Reads the header of a record and returns its flags, deal number, number of moves and size of the timestamps"""
+    if offset + HEADER.size > len(buffer):
+        raise ValueError(f"Replay record is truncated at offset {offset}")
+
+    magic, version, flags, deal, moves_count, times_size = HEADER.unpack_from(buffer, offset)
+
+    if magic != MAGIC:
+        raise ValueError(f"Replay record must start with {MAGIC!r} at offset {offset}: {magic!r}")
+
+    if version != VERSION:
+        raise ValueError(f"Replay version must be {VERSION}: {version}")
+
+    if offset + get_record_size(moves_count, times_size) > len(buffer):
+        raise ValueError(f"Replay record is truncated at offset {offset}")
+
+    return (flags, deal, moves_count, times_size)
+
+
+def read_delays(
+    buffer: bytes | memoryview, offset: int, flags: int, moves_count: int, times_size: int
+) -> list[int] | None:
+    """Reads the delay before each move from the timestamps of a record, None if it has none"""
+    if not flags & HAS_TIMES:
+        if times_size != 0:
+            raise ValueError(f"Replay record without times has {times_size} bytes of times at offset {offset}")
+
+        return None
+
+    # The timestamps must fill their size exactly, a corrupted record is not read past its end
+    end = offset + times_size
+    delays = []
+
+    for _ in range(moves_count):
+        delay, offset = read_varint(buffer, offset, end)
+        delays.append(delay)
+
+    if offset != end:
+        raise ValueError(f"Replay times leave {end - offset} bytes unread at offset {offset}")
+
+    return delays
+
+
+def get_record_size(moves_count: int, times_size: int) -> int:
+    """Returns the number of bytes of a record"""
+    return HEADER.size + 2 * moves_count + times_size
+
+
+class Replay:
+    """Class that holds a recorded game: its deal, its encoded moves and optionally the time of each move"""
+
+    def __init__(self, deal: int, moves: array | None = None, times: array | None = None) -> None:
+        """Instantiate a replay, the times are in milliseconds from the start of the game"""
+        self.deal = deal
+        self.moves = array("H") if moves is None else moves
+        self.times = times
+
+    def __len__(self) -> int:
+        """Returns the number of moves"""
+        return len(self.moves)
+
+    @classmethod
+    def from_journal(cls, deal: int, journal: MoveJournal, with_times: bool = True) -> Replay:
+        """Returns the replay of the moves from the start of the game to the current one"""
+        path = journal.get_path()
+        moves = array("H", (journal.moves[node] for node in path))
+        times = array("I", (journal.times[node] for node in path)) if with_times else None
+        return cls(deal, moves, times)
+
+    def get_move(self, index: int) -> tuple[int, int, int, int, int]:
+        """Returns a move as (source zone, source index, destination zone, destination index, count)"""
+        return decode_move(self.moves[index])
+
+    def encode(self) -> bytes:
+        """Returns the record of the replay"""
+        moves = array("H", self.moves)
+
+        if sys.byteorder == "big":
+            moves.byteswap()
+
+        times = bytearray()
+
+        # Times are stored as the delay since the previous move, which fits in one or two bytes
+        if self.times is not None:
+            previous_time = 0
+
+            for move_time in self.times:
+                write_varint(times, max(move_time - previous_time, 0))
+                previous_time = max(move_time, previous_time)
+
+        flags = HAS_TIMES if self.times is not None else 0
+        header = HEADER.pack(MAGIC, VERSION, flags, self.deal, len(moves), len(times))
+        return header + moves.tobytes() + times
+
+    @classmethod
+    def decode(cls, buffer: bytes | memoryview, offset: int = 0) -> tuple[Replay, int]:
+        """Reads a record and returns its replay with the offset of the next record"""
+        flags, deal, moves_count, times_size = read_header(buffer, offset)
+        offset += HEADER.size
+
+        moves = array("H")
+        moves.frombytes(buffer[offset : offset + 2 * moves_count])
+
+        if sys.byteorder == "big":
+            moves.byteswap()
+
+        offset += 2 * moves_count
+        delays = read_delays(buffer, offset, flags, moves_count, times_size)
+        times = None
+
+        if delays is not None:
+            times = array("I")
+            move_time = 0
+
+            for delay in delays:
+                move_time += delay
+                times.append(move_time)
+
+        return (cls(deal, moves, times), offset + times_size)
+
+
+def iter_replays(buffer: bytes | memoryview) -> Iterator[Replay]:
+    """Generates the replays of the records of a buffer"""
+    offset = 0
+
+    while offset < len(buffer):
+        replay, offset = Replay.decode(buffer, offset)
+        yield replay
+
+
+def read_replays(path: str) -> list[Replay]:
+    """Returns the replays of a file"""
+    with open(path, "rb") as file:
+        return list(iter_replays(file.read()))
+
+
+def append_replay(path: str, replay: Replay) -> None:
+    """Adds a replay at the end of a file"""
+    directory = os.path.dirname(path)
+
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+
+    with open(path, "ab") as file:
+        file.write(replay.encode())
+
+
+def validate_moves(state: GameState, moves: array | memoryview) -> tuple[str, int]:
+    """Plays encoded moves on a table and returns the outcome with the number of legal moves played"""
+    for index, record in enumerate(moves):
+        move = decode_move(record)
+
+        if not state.can_move(*move):
+            return (ILLEGAL, index)
+
+        state.move(*move)
+
+    return (SOLVED if state.is_solved() else UNFINISHED, len(moves))
+
+
+def validate_replay(replay: Replay) -> tuple[str, int]:
+    """Plays a replay on its deal with the rules of the game and returns the outcome with the number of legal moves"""
+    return validate_moves(GameState.from_layout(deal_layout(replay.deal)), replay.moves)
+
+
+def main() -> None:
+    """Validates the replays of files without opening the game"""
+    parser = argparse.ArgumentParser(description="Validates FreeCell replay files against the rules of the game")
+    parser.add_argument("paths", nargs="+", help="replay files")
+    parser.add_argument("-v", "--verbose", action="store_true", help="print the outcome of every replay")
+    args = parser.parse_args()
+
+    outcomes = {SOLVED: 0, UNFINISHED: 0, ILLEGAL: 0}
+    start_time = time.perf_counter()
+
+    for path in args.paths:
+        for index, replay in enumerate(read_replays(path)):
+            outcome, moves_count = validate_replay(replay)
+            outcomes[outcome] += 1
+
+            if args.verbose or outcome == ILLEGAL:
+                print(f"{path}:{index}\tdeal {replay.deal}\t{outcome}\t{moves_count}/{len(replay)} moves")
+
+    elapsed = time.perf_counter() - start_time
+    total = sum(outcomes.values())
+    rate = total / elapsed if elapsed > 0 else 0
+    print(", ".join(f"{count} {outcome}" for outcome, count in outcomes.items()), f"({rate:.0f} replays/s)")
+    sys.exit(1 if outcomes[ILLEGAL] else 0)
+
+
+if __name__ == "__main__":
+    main()
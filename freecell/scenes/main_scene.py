@@ -3,25 +3,39 @@ from __future__ import annotations
 import math
 import random
 import time
+from collections.abc import Iterator
 from typing import TYPE_CHECKING, cast
 
 import pygame
 
 from ..config import Config
 from ..dealer import Dealer
+from ..deals import MAX_CLASSIC_DEAL
 from ..deck import Deck
+from ..journal import MoveJournal
+from ..layout import Layout
 from ..observer import Observer
+from ..renderer import TableRenderer
+from ..replay import Replay, append_replay
+from ..solver import Solver, SolverResult
+from ..sound_bank import SoundBank
 from ..sprites.card import Card, CardState
 from ..sprites.cell import Cell
-from ..sprites.column_cell import ColumnCell
-from ..sprites.foundation_cell import FoundationCell
-from ..sprites.free_cell import FreeCell
 from ..sprites.mouse import Mouse
+from ..state import Zone
+from ..tweens import TweenScheduler
 from .scene import Scene
 
 if TYPE_CHECKING:
     from ..game import Game
 
+# State of the cards dropped in each zone of the table
+ZONE_CARD_STATES = {
+    Zone.foundation_cell: CardState.foundation_cell,
+    Zone.free_cell: CardState.free_cell,
+    Zone.column_cell: CardState.column_cell,
+}
+
 
 class MainScene(Scene, Observer):
     """Class that defines the main scene"""
@@ -33,10 +47,26 @@ class MainScene(Scene, Observer):
         self.config = Config.instance().default
 
         # State
-        self.seed = None
+        self.deal_number = None
         self.is_dragging_card = None
         self.card_being_dragged = None
         self.other_cards_being_dragged: list[Card] = []
+        self.drag_source = None
+        self.drop_targets: dict[Cell, Zone] = {}
+        self.is_pointer_moving = False
+        self.journal = MoveJournal()
+
+        # Wall clock ticks when the cards were dealt, the time played since then stamps the moves of the journal
+        self.is_dealing = False
+        self.deal_end_ticks = 0
+        self.suspend_ticks = 0
+
+        # Replay being played back, the time of its moves is scaled by the speed
+        self.replay = None
+        self.replay_index = 0
+        self.replay_speed = 1.0
+        self.is_replay_saved = False
+        self.is_won = False
 
         # Deck
         self.deck = None
@@ -45,24 +75,26 @@ class MainScene(Scene, Observer):
         self.dealer = None
 
         # Sprites
+        self.layout = Layout()
+        self.tweens = TweenScheduler()
+        self.tweens.attach(self)
         self.mouse_sprite = None
         self.all_sprites = None
-        self.card_sprites = None
         self.cell_sprites = None
+        self.active_sprites = None
+        self.renderer = None
+        self.background = None
         self.click_time = 0
 
-        # Music
-        pygame.mixer.music.load(f"assets/sounds/{self.config["background_music"]}")
-
         # Sounds
+        self.sound_bank = SoundBank.instance()
         self.sound_channel = None
-        self.loading_sound = pygame.mixer.Sound(f"assets/sounds/{self.config["loading_sound"]}")
-        self.start_sound = pygame.mixer.Sound(f"assets/sounds/{self.config["start_sound"]}")
 
-        self.default_font = pygame.font.Font(
-            f"assets/fonts/{self.config["default_font"]}",
-            20,
-        )
+        with self.game.profiler.phase("fonts"):
+            self.default_font = pygame.font.Font(
+                f"assets/fonts/{self.config["default_font"]}",
+                20,
+            )
 
         # Texts
         self.texts = {}
@@ -84,61 +116,99 @@ class MainScene(Scene, Observer):
             self.config["default_font_color"],
             0.25,
         )
+        self.texts["undo"] = self.prepare_text(
+            self.default_font,
+            self.config["undo_text"],
+            self.config["default_font_color"],
+            0.30,
+        )
 
     # Default methods
 
     def ready(self, new_game: bool = True) -> None:
         """Set the scene for execution"""
-        self.sound_channel = pygame.mixer.find_channel()
-        self.sound_channel.queue(self.loading_sound)
-        self.sound_channel.queue(self.start_sound)
-        pygame.mixer.music.play(-1, fade_ms=10000)
+        self.sound_channel = self.sound_bank.play_sequence(self.config["loading_sound"], self.config["start_sound"])
+        self.play_music()
 
         # State
         self.is_dragging_card = False
         self.card_being_dragged = None
-
-        # Deck
-        self.deck = Deck()
+        self.other_cards_being_dragged = []
+        self.game.damage.invalidate()
+        self.tweens.clear()
+
+        # The game left for another one is recorded before its moves are forgotten
+        self.save_replay()
+        self.journal.clear()
+        self.is_dealing = True
+        self.replay = None
+        self.is_replay_saved = False
+        self.is_won = False
+
+        # The sprites are built once and put back on the dealer for the next games
+        if self.deck is None:
+            self.build_table()
+        else:
+            self.deck.reset()
+            self.dealer.reset()
+            self.active_sprites.empty()
 
         if new_game:
-            self.seed = time.time()
+            self.deal_number = random.randint(1, MAX_CLASSIC_DEAL)
 
-        random.seed(self.seed)
-        self.deck.shuffle()
+        self.deck.arrange(self.deal_number)
+        self.texts["deal"] = self.prepare_text(
+            self.default_font,
+            self.config["deal_text"].format(self.deal_number),
+            self.config["default_font_color"],
+            0.35,
+        )
 
-        # Dealer
-        self.dealer = Dealer(self.deck)
-        self.dealer.prepare_table()
         self.dealer.deal()
 
-        # Sprites
-        self.mouse_sprite = Mouse()
-        self.all_sprites = pygame.sprite.LayeredUpdates()
-        self.card_sprites = pygame.sprite.Group()
-        self.cell_sprites = pygame.sprite.Group()
+        # The order of the cards in each layer follows the new deal
+        for card in self.deck.cards:
+            self.update_card_layer(card)
+            self.tweens.start(card)
 
-        # Foundation cell sprites
-        for foundation_cell in self.dealer.foundation_cells:
-            self.cell_sprites.add(foundation_cell)
-            self.all_sprites.add(foundation_cell)
+        self.renderer.invalidate()
+        self.draw_background()
 
-        # Free cell sprites
-        for free_cell in self.dealer.free_cells:
-            self.cell_sprites.add(free_cell)
-            self.all_sprites.add(free_cell)
+    def suspend(self) -> None:
+        """Pauses the game in progress, keeping the table and releasing the cached surfaces"""
+        self.drop_card()
+        self.sound_channel.stop()
+        self.renderer.release()
+        self.background = None
+        self.suspend_ticks = pygame.time.get_ticks()
 
-        # Column cell sprites
-        for column_cell in self.dealer.column_cells:
-            self.cell_sprites.add(column_cell)
-            self.all_sprites.add(column_cell)
+    def resume(self) -> None:
+        """Continues the game in progress"""
+        self.play_music()
 
-        # Card sprites
-        for card in self.deck.cards:
-            card.attach(self)
-            self.card_sprites.add(card)
-            self.all_sprites.add(card)
-            self.all_sprites.add(card.shadow)
+        # The time spent in other scenes is not played
+        self.deal_end_ticks += pygame.time.get_ticks() - self.suspend_ticks
+
+    def quit(self) -> None:
+        """Records the game in progress before the game ends"""
+        self.save_replay()
+
+    def prepare(self) -> Iterator[None]:
+        """Builds the table and the background before the scene is shown, a few milliseconds of work per step"""
+        if self.deck is None:
+            self.build_table()
+            yield
+
+        # The bordered images of the cards are drawn before the first deal needs them, a suit per step
+        for idx, card in enumerate(self.deck.cards, 1):
+            card.add_minimal_border()
+
+            if idx % 13 == 0:
+                yield
+
+        self.background = self.create_background_surface()
+        yield
+        self.draw_background()
 
     def process_events(self, event: pygame.event.Event) -> None:
         """Processes input events"""
@@ -153,6 +223,12 @@ class MainScene(Scene, Observer):
                 pygame.mixer.music.stop()
                 self.ready(False)
 
+            if event.key == pygame.K_z:
+                self.undo()
+
+            if event.key == pygame.K_y:
+                self.redo()
+
             if event.key == pygame.K_BACKSPACE:
                 self.game.change_scene("MenuScene")
 
@@ -166,7 +242,8 @@ class MainScene(Scene, Observer):
                 self.click_time = time.time()
 
         if event.type == pygame.MOUSEMOTION:
-            self.check_card_cell_collision()
+            # The highlight is checked once per frame, however many motion events arrive
+            self.is_pointer_moving = True
 
         if event.type == pygame.MOUSEBUTTONUP:
             if event.button == 1:
@@ -174,22 +251,106 @@ class MainScene(Scene, Observer):
 
     def process_update(self, dt: float) -> None:
         """Processes the sprite update"""
-        self.all_sprites.update(dt=dt)
+        # Moves made before every card arrives end the deal too
+        if self.is_dealing and not (self.tweens.is_running() and len(self.journal) == 0):
+            self.is_dealing = False
+            self.deal_end_ticks = pygame.time.get_ticks()
+
+        if self.replay is not None and not self.is_dealing:
+            self.process_replay()
+
+        self.tweens.step(dt)
+        self.active_sprites.update(dt=dt)
+
+        if self.is_pointer_moving:
+            self.check_card_cell_collision()
+            self.is_pointer_moving = False
 
     def process_draw(self) -> None:
-        """Renders game frames"""
-        for text in self.texts.values():
-            self.game.screen.blit(text[0], text[1])
+        """Renders game frames over the background"""
+        if self.config["table_cache"]:
+            self.renderer.draw(self.game.screen, self.get_dragged_cards(), self.background)
+        else:
+            self.all_sprites.draw(self.game.screen)
+
+    def get_background(self) -> pygame.Surface:
+        """Returns the fill, the cells and the texts drawn on a surface of the screen size"""
+        if self.background is None or self.background.get_size() != self.game.screen.get_size():
+            self.background = self.create_background_surface()
+            self.draw_background()
+
+        return self.background
+
+    def create_background_surface(self) -> pygame.Surface:
+        """Returns an empty surface of the screen size, created in the format of the screen"""
+        return pygame.Surface(self.game.screen.get_size(), 0, self.game.screen)
 
-        self.all_sprites.draw(self.game.screen)
+    def is_animating(self) -> bool:
+        """Checks if a card is being dragged or moving, or a replay is being played back"""
+        return self.is_dragging_card or self.tweens.is_running() or self.replay is not None
 
-    def update(self, card: Card) -> None:
-        """Updates the observer"""
+    def update(self, tweens: TweenScheduler) -> None:
+        """Updates the observer when cards arrive at their cells"""
+        for card in tweens.completed:
+            self.update_card_layer(card)
+            self.renderer.invalidate_cell(*self.dealer.get_card_position(card))
+
+            if card.previous_state != CardState.dealer and card.drop_sound_play:
+                self.sound_bank.play(self.config["card_drop_sound"])
+
+    def update_card_layer(self, card: Card) -> None:
+        """Moves a card and its shadow to the layer of the card"""
         self.all_sprites.change_layer(card, card._layer)
         self.all_sprites.change_layer(card.shadow, card._layer - 1)
+        self.game.damage.add(card.rect)
+        self.game.damage.add(card.shadow.rect)
 
     # Local methods
 
+    def play_music(self) -> None:
+        """Plays the music of the scene, the music of the menu is replaced"""
+        with self.game.profiler.phase("music"):
+            pygame.mixer.music.load(f"assets/sounds/{self.config["background_music"]}")
+
+        pygame.mixer.music.play(-1, fade_ms=10000)
+
+    def build_table(self) -> None:
+        """Builds the deck, the dealer and the sprite groups of the table"""
+        # Deck
+        with self.game.profiler.phase("sprite construction"):
+            self.deck = Deck()
+
+        # Dealer
+        with self.game.profiler.phase("sprite construction"):
+            self.dealer = Dealer(self.deck)
+            self.dealer.prepare_table()
+
+        # Sprites
+        self.mouse_sprite = Mouse()
+        self.all_sprites = pygame.sprite.LayeredUpdates()
+        self.cell_sprites = pygame.sprite.Group()
+        # Only the cards being dragged and their shadows are updated, the tweens move the others
+        self.active_sprites = pygame.sprite.Group()
+
+        # Foundation cell sprites
+        for foundation_cell in self.dealer.foundation_cells:
+            self.cell_sprites.add(foundation_cell)
+
+        # Free cell sprites
+        for free_cell in self.dealer.free_cells:
+            self.cell_sprites.add(free_cell)
+
+        # Column cell sprites
+        for column_cell in self.dealer.column_cells:
+            self.cell_sprites.add(column_cell)
+
+        # Card sprites
+        for card in self.deck.cards:
+            self.all_sprites.add(card)
+            self.all_sprites.add(card.shadow)
+
+        self.renderer = TableRenderer(self.dealer, self.tweens, self.all_sprites)
+
     def update_mouse_sprite(self, return_coordinates: bool = False) -> tuple[int, int] | None:
         """Updates mouse sprite"""
         mouse_x, mouse_y = pygame.mouse.get_pos()
@@ -201,32 +362,70 @@ class MainScene(Scene, Observer):
         else:
             return
 
+    def get_dragged_cards(self) -> list[Card]:
+        """Returns the cards being dragged, from the bottom to the top"""
+        if not self.is_dragging_card:
+            return []
+
+        return [self.card_being_dragged, *self.other_cards_being_dragged]
+
+    def get_card_at(self, x: int, y: int) -> Card | None:
+        """Returns the card on top at a point of the screen"""
+        hit = self.layout.hit(x, y)
+
+        if hit is None:
+            return None
+
+        zone, index, row = hit
+        cards = self.dealer.get_card_slots(zone, index)
+
+        if len(cards) == 0:
+            return None
+
+        if zone != Zone.column_cell:
+            return cards[-1]
+
+        # Beyond the last row the point can still be over the lower part of the top card
+        top_row = len(cards) - 1
+
+        if row > top_row and y >= self.layout.get_cell_position(zone, index, top_row)[1] + self.layout.card_height:
+            return None
+
+        return cards[min(row, top_row)]
+
     def drag_card(self) -> None:
         """Try to pick up a card from the table"""
-        if not self.is_dragging_card:
+        if not self.is_dragging_card and self.replay is None:
             mouse_x, mouse_y = self.update_mouse_sprite(True)
 
-            card_sprites: list[Card] = pygame.sprite.spritecollide(self.mouse_sprite, self.card_sprites, False)
-            card_sprites.sort(key=lambda x: x.row)
+            card_sprite = self.get_card_at(mouse_x, mouse_y)
 
-            if len(card_sprites) > 0:
-                card_sprite = card_sprites[-1]
+            if card_sprite is not None:
                 can_drag, cards_list = self.dealer.can_drag(card_sprite)
 
                 if can_drag:
-                    if cards_list is not None:
-                        self.is_dragging_card = True
-                        self.card_being_dragged = cards_list[0]
-                        self.card_being_dragged.drag_sound.play()
-                        self.other_cards_being_dragged = cards_list[1:]
-
-                        for card in cards_list:
-                            card.drag(self.config["card_being_dragged_layer"], mouse_x, mouse_y)
-                    else:
-                        self.is_dragging_card = True
-                        self.card_being_dragged = card_sprite
-                        self.card_being_dragged.drag_sound.play()
-                        self.card_being_dragged.drag(self.config["card_being_dragged_layer"], mouse_x, mouse_y)
+                    if cards_list is None:
+                        cards_list = [card_sprite]
+
+                    # Every legal destination is known from the moment the cards are picked up
+                    self.drag_source = self.dealer.get_card_position(card_sprite)
+                    self.drop_targets = self.dealer.get_drop_targets(self.drag_source, len(cards_list))
+
+                    self.renderer.invalidate_cell(*self.drag_source)
+                    self.is_dragging_card = True
+                    self.card_being_dragged = cards_list[0]
+                    self.other_cards_being_dragged = cards_list[1:]
+                    self.sound_bank.play(self.config["card_drag_sound"])
+
+                    for card in cards_list:
+                        self.tweens.stop(card)
+                        card.drag(self.config["card_being_dragged_layer"], mouse_x, mouse_y)
+                        self.update_card_layer(card)
+                        self.active_sprites.add(card, card.shadow)
+
+                    if self.config["highlight_drop_targets"]:
+                        for cell_sprite in self.drop_targets:
+                            self.add_cell_sprite_highlight(cell_sprite)
 
     def get_closest_cell_sprite(self, cell_sprites) -> Cell:
         """Returns the cell closest to the card"""
@@ -238,6 +437,23 @@ class MainScene(Scene, Observer):
 
         return min(sprites_distances.items(), key=lambda x: x[1])[0]
 
+    def get_drop_target(self) -> Cell | None:
+        """Returns the legal destination under the card being dragged"""
+        cell_sprites = []
+
+        for zone, index in self.layout.get_candidate_cells(*self.card_being_dragged.rect.center):
+            cell_sprite = self.dealer.get_cell(zone, index)
+
+            if cell_sprite in self.drop_targets and self.card_being_dragged.rect.colliderect(cell_sprite.rect):
+                cell_sprites.append(cell_sprite)
+
+        if len(cell_sprites) == 0:
+            return None
+        elif len(cell_sprites) == 1:
+            return cell_sprites[0]
+        else:
+            return self.get_closest_cell_sprite(cell_sprites)
+
     def fast_foundation_cell_drop_card(self) -> None:
         """Allows for quick sending of valid cards to the foundation cells"""
         pass
@@ -245,132 +461,192 @@ class MainScene(Scene, Observer):
     def drop_card(self) -> None:
         """Try to put a card down on the table"""
         if self.is_dragging_card:
-            is_valid_move = False
+            cell_sprite = self.get_drop_target()
+
+            if cell_sprite is not None:
+                zone = self.drop_targets[cell_sprite]
+                card_state = ZONE_CARD_STATES[zone]
+                cards_list = [self.card_being_dragged, *self.other_cards_being_dragged]
+                self.dealer.move_cards(cards_list, self.drag_source, cell_sprite, zone)
+                self.journal.record(
+                    (*self.drag_source, zone, cell_sprite.column, len(cards_list)),
+                    self.get_play_time(),
+                )
+                self.card_being_dragged.drop(card_state, True)
+
+                for idx, card_being_dragged in enumerate(self.other_cards_being_dragged, 1):
+                    card_being_dragged.drop(card_state, True, -idx / 25, False)
+
+                for card in cards_list:
+                    self.tweens.start(card)
+            else:
+                self.card_being_dragged.drop(self.card_being_dragged.previous_state)
 
-            # Cell Sprites
-            cell_sprites: list[Cell] = pygame.sprite.spritecollide(
-                self.card_being_dragged,
-                self.cell_sprites,
-                False,
-            )
-            cell_sprites_count = len(cell_sprites)
+                for idx, card_being_dragged in enumerate(self.other_cards_being_dragged, 1):
+                    card_being_dragged.drop(
+                        card_being_dragged.previous_state,
+                        moving_time=-idx / 25,
+                        drop_sound_play=False,
+                    )
 
-            if cell_sprites_count > 0:
-                if cell_sprites_count == 1:
-                    closest_cell_sprite = cell_sprites[0]
-                else:
-                    closest_cell_sprite = self.get_closest_cell_sprite(cell_sprites)
+                self.tweens.start(self.card_being_dragged)
 
-                if isinstance(closest_cell_sprite, FoundationCell):
-                    if len(self.other_cards_being_dragged) == 0:
-                        if self.dealer.can_drop_foundation_cell(self.card_being_dragged, closest_cell_sprite):
-                            previous_cell = self.card_being_dragged.cell
+                for card_being_dragged in self.other_cards_being_dragged:
+                    self.tweens.start(card_being_dragged)
 
-                            if self.card_being_dragged.previous_state == CardState.column_cell:
-                                self.dealer.remove_card_column_cell(self.card_being_dragged)
-                            elif self.card_being_dragged.previous_state == CardState.free_cell:
-                                self.dealer.remove_card_free_cell(self.card_being_dragged, previous_cell)
+            self.active_sprites.empty()
+            self.is_dragging_card = False
+            self.card_being_dragged = None
+            self.other_cards_being_dragged = []
+            self.drop_targets = {}
+            self.remove_cell_sprites_highlight()
+            self.check_win()
 
-                            self.dealer.add_card_foundation_cell(self.card_being_dragged, closest_cell_sprite)
-                            self.card_being_dragged.drop(CardState.foundation_cell, True)
-                            is_valid_move = True
+    def undo(self) -> None:
+        """Takes back the last move"""
+        if not self.is_dragging_card and self.replay is None:
+            move = self.journal.undo()
 
-                elif isinstance(closest_cell_sprite, FreeCell):
-                    if len(self.other_cards_being_dragged) == 0:
-                        if self.dealer.can_drop_free_cell(closest_cell_sprite):
-                            previous_cell = self.card_being_dragged.cell
+            if move is not None:
+                self.animate_move(move)
 
-                            if self.card_being_dragged.previous_state == CardState.column_cell:
-                                self.dealer.remove_card_column_cell(self.card_being_dragged)
-                            elif self.card_being_dragged.previous_state == CardState.free_cell:
-                                self.dealer.remove_card_free_cell(self.card_being_dragged, previous_cell)
+    def redo(self) -> None:
+        """Makes again the last move taken back"""
+        if not self.is_dragging_card and self.replay is None:
+            move = self.journal.redo()
 
-                            self.dealer.add_card_free_cell(self.card_being_dragged, closest_cell_sprite)
-                            self.card_being_dragged.drop(CardState.free_cell, True)
-                            is_valid_move = True
+            if move is not None:
+                self.animate_move(move)
 
-                elif isinstance(closest_cell_sprite, ColumnCell):
-                    if self.dealer.can_drop_column_cell(
-                        self.card_being_dragged, closest_cell_sprite, self.other_cards_being_dragged
-                    ):
-                        previous_cell = self.card_being_dragged.cell
+    def animate_move(self, move: tuple[Zone, int, Zone, int, int], duration: float | None = None) -> None:
+        """Applies a move to the table and moves its cards to their new cell"""
+        src_zone, src_index, dst_zone, dst_index, count = move
 
-                        if self.card_being_dragged.previous_state == CardState.column_cell:
-                            self.dealer.remove_card_column_cell(self.card_being_dragged)
+        # The cards fly above the table until they arrive, the dealer then sets the layer of their new cell
+        for card in self.dealer.get_card_slots(src_zone, src_index)[-count:]:
+            self.all_sprites.change_layer(card, self.config["card_being_dragged_layer"])
+            self.all_sprites.change_layer(card.shadow, self.config["card_being_dragged_layer"] - 1)
 
-                            if len(self.other_cards_being_dragged) > 0:
+        cards_list = self.dealer.apply_move(src_zone, src_index, dst_zone, dst_index, count)
 
-                                for card_being_dragged in self.other_cards_being_dragged:
-                                    self.dealer.remove_card_column_cell(card_being_dragged)
+        self.renderer.invalidate_cell(src_zone, src_index)
+        self.renderer.invalidate_cell(dst_zone, dst_index)
+        self.check_win()
 
-                        elif self.card_being_dragged.previous_state == CardState.free_cell:
-                            self.dealer.remove_card_free_cell(self.card_being_dragged, previous_cell)
+        for idx, card in enumerate(cards_list):
+            card.drop(ZONE_CARD_STATES[dst_zone], True, -idx / 25, idx == 0)
+            self.tweens.start(card, duration)
 
-                        self.dealer.add_card_column_cell(self.card_being_dragged, closest_cell_sprite)
-                        self.card_being_dragged.drop(CardState.column_cell, True)
+    def check_win(self) -> None:
+        """Records the game the first time every card reaches the foundation cells, whichever move put the last one"""
+        if self.is_won or not self.dealer.state.is_solved():
+            return
 
-                        if len(self.other_cards_being_dragged) > 0:
-                            idx = 1
-                            for card_being_dragged in self.other_cards_being_dragged:
-                                self.dealer.add_card_column_cell(card_being_dragged, closest_cell_sprite)
-                                card_being_dragged.drop(CardState.column_cell, True, -idx / 25, False)
-                                idx += 1
+        # A game played back is already in a replay file, it is not recorded a second time
+        self.is_won = True
+        self.save_replay()
 
-                        is_valid_move = True
+    def save_replay(self) -> None:
+        """Appends the moves of the game to the replay file, once per game"""
+        if self.is_replay_saved or len(self.journal) == 0 or not self.config["replay_path"]:
+            return
 
-            if not is_valid_move:
-                self.card_being_dragged.drop(self.card_being_dragged.previous_state)
+        append_replay(self.config["replay_path"], Replay.from_journal(self.deal_number, self.journal))
+        self.is_replay_saved = True
 
-                if len(self.other_cards_being_dragged) > 0:
-                    idx = 1
-                    for card_being_dragged in self.other_cards_being_dragged:
-                        card_being_dragged.drop(
-                            card_being_dragged.previous_state,
-                            moving_time=-idx / 25,
-                            drop_sound_play=False,
-                        )
-                        idx += 1
+    def play_replay(self, replay: Replay, speed: float = 1.0) -> None:
+        """Deals the cards of a replay and plays its moves back, faster or slower than they were made"""
+        if self.sound_channel is not None:
+            self.sound_channel.stop()
 
-            self.is_dragging_card = False
-            self.card_being_dragged = None
-            self.other_cards_being_dragged = []
-            self.remove_cell_sprites_highlight()
+        self.deal_number = replay.deal
+        self.ready(False)
+        self.replay = replay
+        self.replay_index = 0
+        self.replay_speed = speed
+        self.is_replay_saved = True
 
-    def check_card_cell_collision(self) -> None:
-        """Checks collision of card with cells"""
-        if self.is_dragging_card:
-            self.update_mouse_sprite(False)
+    def get_play_time(self) -> int:
+        """Returns the wall clock time in milliseconds since the cards were dealt, idle time included"""
+        if self.is_dealing:
+            return 0
 
-            cell_sprites: list[Cell] = pygame.sprite.spritecollide(
-                self.card_being_dragged,
-                self.cell_sprites,
-                False,
-            )
-            cell_sprites_count = len(cell_sprites)
+        return pygame.time.get_ticks() - self.deal_end_ticks
 
-            if cell_sprites_count > 0:
-                if cell_sprites_count == 1:
-                    closest_cell_sprite = cell_sprites[0]
-                else:
-                    closest_cell_sprite = self.get_closest_cell_sprite(cell_sprites)
+    def process_replay(self) -> None:
+        """Makes the moves of the replay whose time has come, the table is interactive again at its end"""
+        replay_time = self.get_play_time() * self.replay_speed
 
-                closest_cell_sprite.add_highlight()
-                self.remove_cell_sprites_highlight(closest_cell_sprite)
+        while self.replay_index < len(self.replay):
+            # Times are in milliseconds, a replay recorded without them is played at a steady pace
+            if self.replay.times is not None:
+                move_time = self.replay.times[self.replay_index]
             else:
-                self.remove_cell_sprites_highlight()
+                move_time = round((self.replay_index + 1) * self.config["replay_move_time"] * 1000)
+
+            if replay_time < move_time:
+                return
+
+            # The playback stops at the first move the rules forbid, the table stays as the legal moves left it
+            move = self.replay.get_move(self.replay_index)
+
+            if not self.dealer.state.can_move(*move):
+                break
+
+            # The move is in the journal before it is animated, so a winning move is recorded with the game
+            self.journal.record(move, move_time)
+            self.animate_move(move, self.config["card_moving_time"] / max(self.replay_speed, 1))
+            self.replay_index += 1
+
+        self.replay = None
+
+    def check_card_cell_collision(self) -> None:
+        """Highlights the legal destination under the card being dragged"""
+        if self.is_dragging_card and not self.config["highlight_drop_targets"]:
+            cell_sprite = self.get_drop_target()
+
+            if cell_sprite is not None and not cell_sprite.highlighted:
+                self.add_cell_sprite_highlight(cell_sprite)
+
+            self.remove_cell_sprites_highlight(cell_sprite)
+
+    def solve(self, solver: Solver | None = None) -> SolverResult:
+        """Searches a solution from the current table"""
+        if solver is None:
+            solver = Solver()
+
+        return solver.solve(self.dealer.state)
 
     def remove_cell_sprites_highlight(self, closest_cell_sprite: Cell = None) -> None:
         """Remove highlight from all cells"""
         cell_sprites_typed = cast(list[Cell], self.cell_sprites.sprites())
 
-        if closest_cell_sprite is not None:
-            for cell_sprite in cell_sprites_typed:
-                if cell_sprite.highlighted and cell_sprite != closest_cell_sprite:
-                    cell_sprite.remove_highlight()
-        else:
-            for cell_sprite in cell_sprites_typed:
-                if cell_sprite.highlighted:
-                    cell_sprite.remove_highlight()
+        for cell_sprite in cell_sprites_typed:
+            if cell_sprite.highlighted and cell_sprite != closest_cell_sprite:
+                cell_sprite.remove_highlight()
+                self.draw_background(cell_sprite.rect)
+
+    def add_cell_sprite_highlight(self, cell_sprite: Cell) -> None:
+        """Highlights a cell and draws it again on the background"""
+        cell_sprite.add_highlight()
+        self.draw_background(cell_sprite.rect)
+
+    def draw_background(self, rect: pygame.Rect | None = None) -> None:
+        """Draws the fill, the cells and the texts on the background, only inside a region if one is given"""
+        if self.background is None:
+            return
+
+        self.background.set_clip(rect)
+        self.background.fill(self.config["screen_color"])
+        self.cell_sprites.draw(self.background)
+
+        for text in self.texts.values():
+            self.background.blit(text[0], text[1])
+
+        self.background.set_clip(None)
+
+        # The cached cells carry a copy of the background under them
+        self.renderer.invalidate_area(rect)
 
     def prepare_text(
         self,
@@ -20,14 +20,15 @@ class MenuScene(Scene):
         self.config = Config.instance().default
 
         # Fonts
-        self.title_font = pygame.font.Font(
-            f"assets/fonts/{self.config["title_font"]}",
-            self.config["title_font_size"],
-        )
-        self.default_font = pygame.font.Font(
-            f"assets/fonts/{self.config["default_font"]}",
-            self.config["default_font_size"],
-        )
+        with self.game.profiler.phase("fonts"):
+            self.title_font = pygame.font.Font(
+                f"assets/fonts/{self.config["title_font"]}",
+                self.config["title_font_size"],
+            )
+            self.default_font = pygame.font.Font(
+                f"assets/fonts/{self.config["default_font"]}",
+                self.config["default_font_size"],
+            )
 
         # Texts
         self.texts = {}
@@ -49,9 +50,11 @@ class MenuScene(Scene):
             self.config["default_font_color"],
             0.68,
         )
+        self.loading_percent = None
 
         # Music
-        pygame.mixer.music.load(f"assets/sounds/{self.config["background_music"]}")
+        with self.game.profiler.phase("music"):
+            pygame.mixer.music.load(f"assets/sounds/{self.config["background_music"]}")
 
     # Default methods
 
@@ -59,6 +62,11 @@ class MenuScene(Scene):
         """Set the scene for execution"""
         pygame.mixer.music.play(-1)
 
+    def resume(self) -> None:
+        """Shows the scene again, the music was replaced by the other scene"""
+        pygame.mixer.music.load(f"assets/sounds/{self.config["background_music"]}")
+        self.ready()
+
     def process_events(self, event: pygame.event.Event) -> None:
         """Processes input events"""
         if event.type == pygame.KEYDOWN:
@@ -73,7 +81,7 @@ class MenuScene(Scene):
 
     def process_update(self, dt: float) -> None:
         """Processes the sprite update"""
-        pass
+        self.update_loading_text()
 
     def process_draw(self) -> None:
         """Renders the frames of the scene"""
@@ -82,6 +90,28 @@ class MenuScene(Scene):
 
     # Local methods
 
+    def update_loading_text(self) -> None:
+        """Shows the progress of the assets loaded in the background, until they are all loaded"""
+        preloader = self.game.preloader
+        loading_percent = None if preloader.is_finished() else round(preloader.progress() * 100)
+
+        if loading_percent == self.loading_percent:
+            return
+
+        self.loading_percent = loading_percent
+
+        if "loading" in self.texts:
+            self.game.damage.add(self.texts.pop("loading")[1])
+
+        if loading_percent is not None:
+            self.texts["loading"] = self.prepare_text(
+                self.default_font,
+                self.config["loading_text"].format(loading_percent),
+                self.config["default_font_color"],
+                0.90,
+            )
+            self.game.damage.add(self.texts["loading"][1])
+
     def prepare_text(
         self,
         font: pygame.font.Font,
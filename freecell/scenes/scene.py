@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
+from collections.abc import Iterator
 from typing import TYPE_CHECKING
 
 import pygame
@@ -36,3 +37,27 @@ class Scene(ABC):
     def process_draw(self) -> None:
         """Renders the frames of the scene"""
         pass
+
+    def prepare(self) -> Iterator[None]:
+        """Builds ahead of time what the scene needs, without showing it, yielding between steps of work"""
+        yield from ()
+
+    def suspend(self) -> None:
+        """Pauses the scene while another scene is shown, releasing what can be built again"""
+        pass
+
+    def resume(self) -> None:
+        """Shows the scene again after it was suspended"""
+        self.ready()
+
+    def quit(self) -> None:
+        """Saves what must outlive the game before it ends"""
+        pass
+
+    def get_background(self) -> pygame.Surface | None:
+        """Returns the static part of the frames, drawn before the scene, or None to fill the screen"""
+        return None
+
+    def is_animating(self) -> bool:
+        """Checks if the scene needs frames at the full rate"""
+        return False
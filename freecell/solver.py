@@ -0,0 +1,362 @@
+from __future__ import annotations
+
+import heapq
+import time
+import tracemalloc
+from collections.abc import Iterator
+
+from .deals import deal_layout
+from .state import (
+    CARDS_COUNT,
+    COLOR,
+    EMPTY,
+    RANK,
+    SUIT,
+    GameState,
+    Zone,
+    card_name,
+    is_stackable,
+)
+
+# A move is (source zone, source index, destination zone, destination index, number of cards)
+Move = tuple[int, int, int, int, int]
+
+SOLVED = "solved"
+UNSOLVABLE = "unsolvable"
+TIMEOUT = "timeout"
+
+_FOUNDATION = int(Zone.foundation_cell)
+_FREE = int(Zone.free_cell)
+_COLUMN = int(Zone.column_cell)
+
+
+class SolverResult:
+    """Class that holds the outcome of a search"""
+
+    def __init__(
+        self,
+        status: str,
+        moves: list[Move],
+        nodes: int,
+        elapsed: float,
+        table_entries: int,
+        peak_queue_size: int,
+        peak_memory: int | None,
+        process_max_rss: int,
+    ) -> None:
+        """Instantiate the outcome of a search"""
+        self.status = status
+        self.moves = moves
+        self.nodes = nodes
+        self.elapsed = elapsed
+
+        # Growth of the search: tables in the transposition table and largest size of the queue
+        self.table_entries = table_entries
+        self.peak_queue_size = peak_queue_size
+
+        # Peak memory allocated by the search, only measured when the solver tracks memory
+        self.peak_memory = peak_memory
+        self.process_max_rss = process_max_rss
+
+    @property
+    def is_solved(self) -> bool:
+        """Checks if the search found a solution"""
+        return self.status == SOLVED
+
+    def __repr__(self) -> str:
+        return (
+            f"SolverResult(status={self.status!r}, moves={len(self.moves)}, nodes={self.nodes}, "
+            f"elapsed={self.elapsed:.3f}, table_entries={self.table_entries}, "
+            f"peak_queue_size={self.peak_queue_size}, peak_memory={self.peak_memory}, "
+            f"process_max_rss={self.process_max_rss})"
+        )
+
+
+class Solver:
+    """Class that solves a table with a weighted best-first search"""
+
+    def __init__(
+        self,
+        max_nodes: int = 200_000,
+        time_limit: float = 10.0,
+        table_size: int = 2_000_000,
+        track_memory: bool = False,
+    ) -> None:
+        """Instantiate the solver with its search budget"""
+        self.max_nodes = max_nodes
+        self.time_limit = time_limit
+        self.table_size = table_size
+        self.track_memory = track_memory
+
+    def solve(self, state: GameState) -> SolverResult:
+        """Searches the sequence of moves that takes every card to the foundation cells"""
+        if self.track_memory:
+            tracemalloc.start()
+
+        start_time = time.perf_counter()
+        deadline = start_time + self.time_limit
+        status, moves, nodes, table_entries, peak_queue_size = self._search(state.copy(), deadline)
+        elapsed = time.perf_counter() - start_time
+        peak_memory = None
+
+        if self.track_memory:
+            peak_memory = tracemalloc.get_traced_memory()[1]
+            tracemalloc.stop()
+
+        return SolverResult(status, moves, nodes, elapsed, table_entries, peak_queue_size, peak_memory, _max_rss())
+
+    def _search(self, root: GameState, deadline: float) -> tuple[str, list[Move], int, int, int]:
+        """Runs the search and returns its status, the solution, the number of expanded nodes and its growth"""
+        path = _auto_play(root)
+
+        if root.is_solved():
+            return (SOLVED, path, 0, 0, 0)
+
+        # Paths are stored as linked tuples (moves, parent path) shared between nodes
+        table = {root.canonical_key()}
+        queue = [(_heuristic(root), 0, root, (path, None))]
+        counter = 1
+        nodes = 0
+        peak_queue_size = 1
+
+        while queue:
+            _, _, state, path = heapq.heappop(queue)
+            nodes += 1
+
+            if nodes > self.max_nodes or (nodes & 0xFF == 0 and time.perf_counter() > deadline):
+                return (TIMEOUT, [], nodes, len(table), peak_queue_size)
+
+            for move in _moves(state):
+                child = state.copy()
+                child.move(*move)
+                auto_moves = _auto_play(child)
+                key = child.canonical_key()
+
+                if key in table:
+                    continue
+
+                child_path = ([move, *auto_moves], path)
+
+                if child.is_solved():
+                    return (SOLVED, _unwind(child_path), nodes, len(table), peak_queue_size)
+
+                if len(table) >= self.table_size:
+                    return (TIMEOUT, [], nodes, len(table), peak_queue_size)
+
+                table.add(key)
+                heapq.heappush(queue, (_heuristic(child), counter, child, child_path))
+                counter += 1
+
+            peak_queue_size = max(peak_queue_size, len(queue))
+
+        # Every legal move up to the symmetries of the canonical key was tried, so no solution exists
+        return (UNSOLVABLE, [], nodes, len(table), peak_queue_size)
+
+
+def _max_rss() -> int:
+    """Returns the peak resident memory of the whole process in bytes, not only of the search"""
+    try:
+        import resource
+    except ImportError:
+        return 0
+
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * 1024
+
+
+def _unwind(path: tuple | None) -> list[Move]:
+    """Returns the moves of a linked path from the root"""
+    chunks = []
+
+    while path is not None:
+        chunks.append(path[0])
+        path = path[1]
+
+    return [move for chunk in reversed(chunks) for move in chunk]
+
+
+def _heuristic(state: GameState) -> int:
+    """Estimates how far a table is from being solved"""
+    score = 2 * (CARDS_COUNT - state.foundation_count())
+
+    # Cards placed over a lower card must be moved before it can reach the foundation cells
+    for cards in state.columns:
+        lowest = 13
+
+        for card in cards:
+            rank = RANK[card]
+
+            if rank > lowest:
+                score += 1
+            else:
+                lowest = rank
+
+    for card in state.free_cells:
+        if card != EMPTY:
+            score += 1
+
+    return score
+
+
+def _foundation_index(state: GameState, card: int) -> int:
+    """Returns the foundation cell that accepts a card or -1"""
+    for index, top_card in enumerate(state.foundation_cells):
+        if top_card == EMPTY:
+            if RANK[card] == 0:
+                return index
+        elif top_card + 1 == card and RANK[card] != 0:
+            return index
+
+    return -1
+
+
+def _auto_play(state: GameState) -> list[Move]:
+    """Moves to the foundation cells every card that no longer helps on the table"""
+    ranks = [0, 0, 0, 0]
+    moves = []
+    moved = True
+
+    for card in state.foundation_cells:
+        if card != EMPTY:
+            ranks[SUIT[card]] = RANK[card] + 1
+
+    while moved:
+        moved = False
+
+        for zone, cards in ((_FREE, state.free_cells), (_COLUMN, None)):
+            sources = range(4) if zone == _FREE else range(8)
+
+            for index in sources:
+                if cards is None:
+                    column = state.columns[index]
+                    card = column[-1] if column else EMPTY
+                else:
+                    card = cards[index]
+
+                if card == EMPTY:
+                    continue
+
+                rank = RANK[card]
+
+                if rank != ranks[SUIT[card]]:
+                    continue
+
+                # Safe when no card of the other color on the table can still be placed over it
+                color = COLOR[card]
+                opposite = min(ranks[suit] for suit in range(4) if COLOR[suit * 13] != color)
+
+                if rank > 1 and rank > opposite:
+                    continue
+
+                move = (zone, index, _FOUNDATION, _foundation_index(state, card), 1)
+                state.move(*move)
+                moves.append(move)
+                ranks[SUIT[card]] += 1
+                moved = True
+
+    return moves
+
+
+def _moves(state: GameState) -> Iterator[Move]:
+    """Generates the atomic moves and supermoves of a table, the most promising first"""
+    # Tables that only differ by the order of the empty columns or free cells share a canonical key,
+    # so a single empty column and a single free cell are enough as destinations
+    columns = state.columns
+    free_cells = state.free_cells
+    valid_cells_count = state.empty_free_cells_count + state.empty_columns_count
+    first_empty_column = next((column for column in range(8) if not columns[column]), -1)
+    first_free_cell = free_cells.find(EMPTY)
+
+    # Moves to the foundation cells
+    for index, card in enumerate(free_cells):
+        if card != EMPTY:
+            target = _foundation_index(state, card)
+
+            if target >= 0:
+                yield (_FREE, index, _FOUNDATION, target, 1)
+
+    for column, cards in enumerate(columns):
+        if cards:
+            target = _foundation_index(state, cards[-1])
+
+            if target >= 0:
+                yield (_COLUMN, column, _FOUNDATION, target, 1)
+
+    # Moves from the free cells to the column cells
+    for index, card in enumerate(free_cells):
+        if card == EMPTY:
+            continue
+
+        for column, cards in enumerate(columns):
+            if cards and is_stackable(card, cards[-1]):
+                yield (_FREE, index, _COLUMN, column, 1)
+
+        if first_empty_column >= 0:
+            yield (_FREE, index, _COLUMN, first_empty_column, 1)
+
+    # Moves between column cells, including sequences of cards (supermoves)
+    for src, cards in enumerate(columns):
+        if not cards:
+            continue
+
+        length = len(cards)
+        run = state.run_length(src)
+
+        for dst, dst_cards in enumerate(columns):
+            if dst == src or not dst_cards:
+                continue
+
+            count = RANK[dst_cards[-1]] - RANK[cards[-1]]
+
+            if 1 <= count <= run and is_stackable(cards[-count], dst_cards[-1]):
+                if count - 1 <= valid_cells_count:
+                    yield (_COLUMN, src, _COLUMN, dst, count)
+
+        # Any part of the run can be moved to an empty column, except a whole column which would not change the table
+        if first_empty_column >= 0:
+            for count in range(min(run, valid_cells_count, length - 1), 0, -1):
+                yield (_COLUMN, src, _COLUMN, first_empty_column, count)
+
+    # Moves from the column cells to the free cells
+    if first_free_cell >= 0:
+        for column, cards in enumerate(columns):
+            if cards:
+                yield (_COLUMN, column, _FREE, first_free_cell, 1)
+
+
+def format_move(state: GameState, move: Move) -> str:
+    """Returns a readable description of a move on a table"""
+    src_zone, src_index, dst_zone, dst_index, count = move
+
+    if src_zone == _FREE:
+        card = state.free_cells[src_index]
+    else:
+        card = state.columns[src_index][-count]
+
+    zone_names = {_FOUNDATION: "foundation", _FREE: "free cell", _COLUMN: "column"}
+    cards = card_name(card) if count == 1 else f"{count} cards from {card_name(card)}"
+    return f"{cards}: {zone_names[src_zone]} {src_index + 1} -> {zone_names[dst_zone]} {dst_index + 1}"
+
+
+def main() -> None:
+    """Solves a numbered deal and prints the solution"""
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Solves a FreeCell deal")
+    parser.add_argument("deal", type=int, help="number of the deal")
+    parser.add_argument("--max-nodes", type=int, default=200_000)
+    parser.add_argument("--time-limit", type=float, default=10.0)
+    parser.add_argument("--track-memory", action="store_true")
+    args = parser.parse_args()
+
+    state = GameState.from_layout(deal_layout(args.deal))
+    result = Solver(args.max_nodes, args.time_limit, track_memory=args.track_memory).solve(state)
+
+    for move in result.moves:
+        print(format_move(state, move))
+        state.move(*move)
+
+    print(result)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,69 @@
+import pygame
+
+from .config import Config
+
+
+class SoundBank:
+    """Class that loads each sound of the game once and plays it on a fixed pool of channels"""
+
+    _instance = None
+
+    def __init__(self) -> None:
+        """Instantiate the sound bank"""
+        self.config = Config.instance().default
+        self._sounds: dict[str, pygame.mixer.Sound] = {}
+        self._last_play_times: dict[str, int] = {}
+        self.coalesce_time = round(self.config["sound_coalesce_time"] * 1000)
+
+        # The pool plays short effects, the last reserved channel plays queued sequences
+        channels_count = self.config["sound_channels"]
+        pygame.mixer.set_num_channels(channels_count + 1)
+        pygame.mixer.set_reserved(channels_count + 1)
+        self._channels = [pygame.mixer.Channel(idx) for idx in range(channels_count)]
+        self._next_channel = 0
+        self.sequence_channel = pygame.mixer.Channel(channels_count)
+
+    @classmethod
+    def instance(cls):
+        """Returns the sound bank instance"""
+        if cls._instance is None:
+            cls._instance = cls()
+
+        return cls._instance
+
+    def get(self, sound: str) -> pygame.mixer.Sound:
+        """Returns a sound from the assets, loading it on the first request"""
+        sound_object = self._sounds.get(sound)
+
+        if sound_object is None:
+            sound_object = pygame.mixer.Sound(f"assets/sounds/{sound}")
+            self._sounds[sound] = sound_object
+
+        return sound_object
+
+    def add(self, sound: str, sound_object: pygame.mixer.Sound) -> None:
+        """Keeps a sound loaded elsewhere, unless it was already loaded"""
+        self._sounds.setdefault(sound, sound_object)
+
+    def play(self, sound: str) -> pygame.mixer.Channel | None:
+        """Plays a sound on the next channel of the pool, merging repeated plays of the same sound"""
+        now = pygame.time.get_ticks()
+        last_play_time = self._last_play_times.get(sound)
+
+        if last_play_time is not None and now - last_play_time < self.coalesce_time:
+            return None
+
+        self._last_play_times[sound] = now
+        channel = self._channels[self._next_channel]
+        self._next_channel = (self._next_channel + 1) % len(self._channels)
+        channel.play(self.get(sound))
+        return channel
+
+    def play_sequence(self, *sounds: str) -> pygame.mixer.Channel:
+        """Plays sounds one after the other on the sequence channel"""
+        self.sequence_channel.stop()
+
+        for sound in sounds:
+            self.sequence_channel.queue(self.get(sound))
+
+        return self.sequence_channel
@@ -1,5 +1,7 @@
 from abc import ABC, abstractmethod
 
+import pygame
+
 
 class Cell(ABC):
     """Class that defines a cell"""
@@ -9,6 +11,27 @@ class Cell(ABC):
         super().__init__()
         self.highlighted = False
 
+    def create_image(self, image: pygame.Surface) -> pygame.Surface:
+        """Returns a translucent copy of the cell image"""
+        image = image.copy()
+        image.set_alpha(self.config["cell_alpha"])
+        return image
+
+    def create_highlighted_image(self, image: pygame.Surface) -> pygame.Surface:
+        """Returns a translucent copy of the cell image with a highlight"""
+        image = self.create_image(image)
+        pygame.draw.rect(
+            image,
+            self.config["cell_highlight_color"],
+            pygame.Rect(
+                self.config["cell_border_width"],
+                self.config["cell_border_width"],
+                self.config["card_width"] - (2 * self.config["cell_border_width"]),
+                self.config["card_height"] - (2 * self.config["cell_border_width"]),
+            ),
+        )
+        return image
+
     @abstractmethod
     def add_highlight(self) -> None:
         """Adds highlight to a cell"""
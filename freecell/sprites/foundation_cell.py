@@ -1,8 +1,9 @@
-import cv2 as cv
 import pygame
 
 from ..config import Config
+from ..damage import DamageTracker
 from ..sprites.cell import Cell
+from ..textures import TextureCache
 
 
 class FoundationCell(pygame.sprite.Sprite, Cell):
@@ -14,20 +15,9 @@ class FoundationCell(pygame.sprite.Sprite, Cell):
         Cell.__init__(self)
         self.config = Config.instance().default
 
-        image_source = cv.imread(f"assets/sprites/{self.config["foundation_cell_sprite"]}", cv.IMREAD_UNCHANGED)
-        image = cv.cvtColor(image_source, cv.COLOR_BGRA2RGBA)
-        image_resized = cv.resize(
-            image,
-            (self.config["card_width"], self.config["card_height"]),
-            interpolation=cv.INTER_AREA,
-        )
-        self.default_image = pygame.image.frombytes(
-            image_resized.tobytes(),
-            (self.config["card_width"], self.config["card_height"]),
-            "RGBA",
-        ).convert_alpha()
-        self.image = self.default_image.copy()
-        self.image.set_alpha(self.config["cell_alpha"])
+        self.sprite = self.config["foundation_cell_sprite"]
+        self.default_image = TextureCache.instance().get_variant("cell", self.sprite, self.create_image)
+        self.image = self.default_image
         self.rect = self.image.get_rect()
         self._layer = -2
 
@@ -40,22 +30,18 @@ class FoundationCell(pygame.sprite.Sprite, Cell):
     def add_highlight(self) -> None:
         """Adds highlight to a foundation cell"""
         self.highlighted = True
-        pygame.draw.rect(
-            self.image,
-            self.config["cell_highlight_color"],
-            pygame.Rect(
-                self.config["cell_border_width"],
-                self.config["cell_border_width"],
-                self.config["card_width"] - (2 * self.config["cell_border_width"]),
-                self.config["card_height"] - (2 * self.config["cell_border_width"]),
-            ),
+        DamageTracker.instance().add(self.rect)
+        self.image = TextureCache.instance().get_variant(
+            "highlighted_cell",
+            self.sprite,
+            self.create_highlighted_image,
         )
 
     def remove_highlight(self) -> None:
         """Remove highlight from a foundation cell"""
         self.highlighted = False
-        self.image = self.default_image.copy()
-        self.image.set_alpha(self.config["cell_alpha"])
+        DamageTracker.instance().add(self.rect)
+        self.image = self.default_image
 
     def update(self, dt: float) -> None:
         """Processes the sprite update"""
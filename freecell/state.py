@@ -0,0 +1,401 @@
+from __future__ import annotations
+
+from collections.abc import Iterable, Sequence
+from enum import IntEnum
+
+# Card encoding: code = suit * 13 + rank, with suits in the order of the
+# configuration (Clubs, Diamonds, Hearts, Spades) and ranks from A (0) to K (12)
+SUITS_COUNT = 4
+RANKS_COUNT = 13
+CARDS_COUNT = SUITS_COUNT * RANKS_COUNT
+RED_SUITS = (1, 2)
+
+# Marks an empty free cell or foundation cell
+EMPTY = 0xFF
+
+FOUNDATION_CELLS_COUNT = 4
+FREE_CELLS_COUNT = 4
+COLUMN_CELLS_COUNT = 8
+
+# Lookup tables indexed by card code
+RANK = bytes(code % RANKS_COUNT for code in range(CARDS_COUNT))
+SUIT = bytes(code // RANKS_COUNT for code in range(CARDS_COUNT))
+COLOR = bytes(int(code // RANKS_COUNT in RED_SUITS) for code in range(CARDS_COUNT))
+
+_SUIT_NAMES = "CDHS"
+_RANK_NAMES = ("A", "2", "3", "4", "5", "6", "7", "8", "9", "T", "J", "Q", "K")
+
+
+class Zone(IntEnum):
+    """Class that defines the zones of the table where cards can be placed"""
+
+    foundation_cell = 0
+    free_cell = 1
+    column_cell = 2
+
+
+def card_code(suit: int, rank: int) -> int:
+    """Returns the code of a card from its suit and rank indexes"""
+    return suit * RANKS_COUNT + rank
+
+
+def card_name(card: int) -> str:
+    """Returns the short name of a card (e.g. "TH" for the ten of hearts)"""
+    return _RANK_NAMES[RANK[card]] + _SUIT_NAMES[SUIT[card]]
+
+
+def parse_cards(names: Sequence[str]) -> list[int]:
+    """Returns the codes of cards from their short names"""
+    return [card_code(_SUIT_NAMES.index(name[-1]), _RANK_NAMES.index(name[:-1])) for name in names]
+
+
+def is_stackable(card: int, top_card: int) -> bool:
+    """Checks if a card can be placed over another one in a column"""
+    return RANK[card] + 1 == RANK[top_card] and COLOR[card] != COLOR[top_card]
+
+
+class GameState:
+    """Class that holds the table as plain data and applies the rules of the game"""
+
+    __slots__ = (
+        "columns",
+        "free_cells",
+        "foundation_cells",
+        "run_lengths",
+        "empty_free_cells_count",
+        "empty_columns_count",
+    )
+
+    def __init__(self) -> None:
+        """Instantiate an empty table"""
+        self.columns: list[bytearray] = [bytearray() for _ in range(COLUMN_CELLS_COUNT)]
+        self.free_cells = bytearray([EMPTY]) * FREE_CELLS_COUNT
+        self.foundation_cells = bytearray([EMPTY]) * FOUNDATION_CELLS_COUNT
+
+        # Kept up to date by every mutation: run_lengths[column][row] is the size of the
+        # sequence in descending order and alternating colors that ends at that row
+        self.run_lengths: list[bytearray] = [bytearray() for _ in range(COLUMN_CELLS_COUNT)]
+        self.empty_free_cells_count = FREE_CELLS_COUNT
+        self.empty_columns_count = COLUMN_CELLS_COUNT
+
+    def clear(self) -> None:
+        """Empties the table in place"""
+        for column, run_lengths in zip(self.columns, self.run_lengths):
+            column.clear()
+            run_lengths.clear()
+
+        self.free_cells[:] = bytes([EMPTY]) * FREE_CELLS_COUNT
+        self.foundation_cells[:] = bytes([EMPTY]) * FOUNDATION_CELLS_COUNT
+        self.empty_free_cells_count = FREE_CELLS_COUNT
+        self.empty_columns_count = COLUMN_CELLS_COUNT
+
+    @classmethod
+    def from_layout(cls, columns: Iterable[Iterable[int]]) -> GameState:
+        """Returns a table with the given cards dealt in the column cells"""
+        state = cls()
+
+        for column, cards in enumerate(columns):
+            for card in cards:
+                state.add_card_column_cell(card, column)
+
+        return state
+
+    @classmethod
+    def from_key(cls, key: bytes) -> GameState:
+        """Returns the table identified by a byte string of key()"""
+        *columns, cells = key.split(b"\xfe")
+        state = cls.from_layout(columns)
+
+        for index, card in enumerate(cells[:FREE_CELLS_COUNT]):
+            if card != EMPTY:
+                state.add_card_free_cell(card, index)
+
+        state.foundation_cells[:] = cells[FREE_CELLS_COUNT:]
+        return state
+
+    def copy(self) -> GameState:
+        """Returns an independent copy of the table"""
+        state = GameState.__new__(GameState)
+        state.columns = [column[:] for column in self.columns]
+        state.free_cells = self.free_cells[:]
+        state.foundation_cells = self.foundation_cells[:]
+        state.run_lengths = [run_lengths[:] for run_lengths in self.run_lengths]
+        state.empty_free_cells_count = self.empty_free_cells_count
+        state.empty_columns_count = self.empty_columns_count
+        return state
+
+    def key(self) -> bytes:
+        """Returns a compact byte string that identifies the table"""
+        return b"\xfe".join(self.columns) + b"\xfe" + self.free_cells + self.foundation_cells
+
+    def canonical_key(self) -> bytes:
+        """Returns a key of the layout of key() that is the same for tables that only differ by the order of cells"""
+        # The solver and the replay statistics share this key, so their positions always agree
+        return (
+            b"\xfe".join(sorted(self.columns))
+            + b"\xfe"
+            + bytes(sorted(self.free_cells))
+            + bytes(sorted(self.foundation_cells))
+        )
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, GameState):
+            return NotImplemented
+
+        return self.key() == other.key()
+
+    def __hash__(self) -> int:
+        return hash(self.key())
+
+    def __repr__(self) -> str:
+        lines = [
+            " ".join(".." if card == EMPTY else card_name(card) for card in self.free_cells)
+            + " | "
+            + " ".join(".." if card == EMPTY else card_name(card) for card in self.foundation_cells)
+        ]
+
+        for row in range(max(len(column) for column in self.columns)):
+            lines.append(
+                " ".join(card_name(column[row]) if row < len(column) else "  " for column in self.columns).rstrip()
+            )
+
+        return "\n".join(lines)
+
+    # Query methods
+
+    def foundation_count(self) -> int:
+        """Returns the number of cards in the foundation cells"""
+        count = 0
+
+        for card in self.foundation_cells:
+            if card != EMPTY:
+                count += RANK[card] + 1
+
+        return count
+
+    def is_solved(self) -> bool:
+        """Checks if all cards are in the foundation cells"""
+        return self.foundation_count() == CARDS_COUNT
+
+    def run_length(self, column: int) -> int:
+        """Returns the size of the sequence in descending order and alternating colors at the top of a column"""
+        run_lengths = self.run_lengths[column]
+        return run_lengths[-1] if run_lengths else 0
+
+    def get_valid_cells_count(self, column: int = -1) -> int:
+        """Returns the number of cells that can hold a card during a multiple card movement"""
+        valid_cells_count = self.empty_free_cells_count + self.empty_columns_count
+
+        if column >= 0 and not self.columns[column]:
+            valid_cells_count -= 1
+
+        return valid_cells_count
+
+    # Verification methods
+
+    def can_drag_column_cell(self, column: int, row: int) -> bool:
+        """Checks if the cards of a column can be picked up from a row"""
+        length = len(self.columns[column])
+        return 0 <= row < length and length - row <= self.run_length(column)
+
+    def can_drag_free_cell(self, index: int) -> bool:
+        """Checks if the card of a free cell can be picked up"""
+        return self.free_cells[index] != EMPTY
+
+    def can_drop_foundation_cell(self, card: int, index: int) -> bool:
+        """Checks if a card can be dropped into a foundation cell"""
+        top_card = self.foundation_cells[index]
+
+        if top_card == EMPTY:
+            return RANK[card] == 0
+
+        return top_card + 1 == card and RANK[card] != 0
+
+    def can_drop_free_cell(self, index: int) -> bool:
+        """Checks if a card can be dropped into a free cell"""
+        return self.free_cells[index] == EMPTY
+
+    def can_drop_column_cell(self, card: int, column: int, count: int = 1) -> bool:
+        """Checks if a card, with count - 1 cards over it, can be dropped into a column cell"""
+        if count - 1 > self.get_valid_cells_count(column):
+            return False
+
+        cards = self.columns[column]
+        return not cards or is_stackable(card, cards[-1])
+
+    def top_card(self, zone: int, index: int) -> int:
+        """Returns the top card of a cell or EMPTY"""
+        match zone:
+            case Zone.foundation_cell:
+                return self.foundation_cells[index]
+            case Zone.free_cell:
+                return self.free_cells[index]
+            case _:
+                cards = self.columns[index]
+                return cards[-1] if cards else EMPTY
+
+    def can_move(self, src_zone: int, src_index: int, dst_zone: int, dst_index: int, count: int = 1) -> bool:
+        """Checks if count cards can be moved from one cell to another"""
+        if src_zone == dst_zone and src_index == dst_index:
+            return False
+
+        match src_zone:
+            case Zone.free_cell:
+                if count != 1 or not self.can_drag_free_cell(src_index):
+                    return False
+                card = self.free_cells[src_index]
+            case Zone.column_cell:
+                cards = self.columns[src_index]
+                if not self.can_drag_column_cell(src_index, len(cards) - count):
+                    return False
+                card = cards[-count]
+            case _:
+                return False
+
+        match dst_zone:
+            case Zone.foundation_cell:
+                return count == 1 and self.can_drop_foundation_cell(card, dst_index)
+            case Zone.free_cell:
+                return count == 1 and self.can_drop_free_cell(dst_index)
+            case _:
+                return self.can_drop_column_cell(card, dst_index, count)
+
+    # Addition methods
+
+    def add_card_foundation_cell(self, card: int, index: int) -> None:
+        """Add a card to a foundation cell"""
+        self.foundation_cells[index] = card
+
+    def add_card_free_cell(self, card: int, index: int) -> None:
+        """Add a card to a free cell"""
+        self.free_cells[index] = card
+        self.empty_free_cells_count -= 1
+
+    def add_card_column_cell(self, card: int, column: int) -> None:
+        """Add a card to a column cell"""
+        cards = self.columns[column]
+        run_lengths = self.run_lengths[column]
+
+        if not cards:
+            self.empty_columns_count -= 1
+            run_lengths.append(1)
+        elif is_stackable(card, cards[-1]):
+            run_lengths.append(run_lengths[-1] + 1)
+        else:
+            run_lengths.append(1)
+
+        cards.append(card)
+
+    # Removal methods
+
+    def remove_card_foundation_cell(self, index: int) -> int:
+        """Remove the top card from a foundation cell"""
+        card = self.foundation_cells[index]
+        self.foundation_cells[index] = EMPTY if RANK[card] == 0 else card - 1
+        return card
+
+    def remove_card_free_cell(self, index: int) -> int:
+        """Remove the card from a free cell"""
+        card = self.free_cells[index]
+        self.free_cells[index] = EMPTY
+        self.empty_free_cells_count += 1
+        return card
+
+    def remove_card_column_cell(self, column: int) -> int:
+        """Remove the top card from a column cell"""
+        cards = self.columns[column]
+        self.run_lengths[column].pop()
+
+        if len(cards) == 1:
+            self.empty_columns_count += 1
+
+        return cards.pop()
+
+    # Movement methods
+
+    def move(self, src_zone: int, src_index: int, dst_zone: int, dst_index: int, count: int = 1) -> None:
+        """Moves count cards from one cell to another without checking the rules"""
+        match src_zone:
+            case Zone.foundation_cell:
+                cards = bytes((self.remove_card_foundation_cell(src_index),))
+            case Zone.free_cell:
+                cards = bytes((self.remove_card_free_cell(src_index),))
+            case _:
+                column = self.columns[src_index]
+                cards = bytes(column[-count:])
+                del column[-count:]
+                del self.run_lengths[src_index][-count:]
+
+                if not column:
+                    self.empty_columns_count += 1
+
+        match dst_zone:
+            case Zone.foundation_cell:
+                self.add_card_foundation_cell(cards[0], dst_index)
+            case Zone.free_cell:
+                self.add_card_free_cell(cards[0], dst_index)
+            case _:
+                for card in cards:
+                    self.add_card_column_cell(card, dst_index)
+
+    def legal_moves(self) -> list[tuple[int, int, int, int, int]]:
+        """Returns every legal move as (source zone, source index, destination zone, destination index, count)"""
+        moves = []
+        columns = self.columns
+        free_cells = self.free_cells
+        foundation_cells = self.foundation_cells
+        empty_columns = [column for column in range(COLUMN_CELLS_COUNT) if not columns[column]]
+        empty_free_cells = [index for index in range(FREE_CELLS_COUNT) if free_cells[index] == EMPTY]
+        valid_cells_count = self.empty_free_cells_count + self.empty_columns_count
+
+        # Single cards from the free cells
+        for src, card in enumerate(free_cells):
+            if card == EMPTY:
+                continue
+
+            for dst in range(FOUNDATION_CELLS_COUNT):
+                if self.can_drop_foundation_cell(card, dst):
+                    moves.append((Zone.free_cell, src, Zone.foundation_cell, dst, 1))
+
+            for dst in range(FREE_CELLS_COUNT):
+                if dst != src and free_cells[dst] == EMPTY:
+                    moves.append((Zone.free_cell, src, Zone.free_cell, dst, 1))
+
+            for dst, cards in enumerate(columns):
+                if not cards or is_stackable(card, cards[-1]):
+                    moves.append((Zone.free_cell, src, Zone.column_cell, dst, 1))
+
+        # Cards and sequences of cards from the column cells
+        for src, cards in enumerate(columns):
+            if not cards:
+                continue
+
+            card = cards[-1]
+            run_length = self.run_lengths[src][-1]
+
+            for dst in range(FOUNDATION_CELLS_COUNT):
+                top_card = foundation_cells[dst]
+
+                if (RANK[card] == 0) if top_card == EMPTY else (top_card + 1 == card and RANK[card] != 0):
+                    moves.append((Zone.column_cell, src, Zone.foundation_cell, dst, 1))
+
+            for dst in empty_free_cells:
+                moves.append((Zone.column_cell, src, Zone.free_cell, dst, 1))
+
+            for dst, dst_cards in enumerate(columns):
+                if dst == src or not dst_cards:
+                    continue
+
+                # Only one size of sequence can fit over the top card of the destination
+                count = RANK[dst_cards[-1]] - RANK[card]
+
+                if 1 <= count <= run_length and count - 1 <= valid_cells_count:
+                    if is_stackable(cards[-count], dst_cards[-1]):
+                        moves.append((Zone.column_cell, src, Zone.column_cell, dst, count))
+
+            for dst in empty_columns:
+                for count in range(1, min(run_length, valid_cells_count) + 1):
+                    moves.append((Zone.column_cell, src, Zone.column_cell, dst, count))
+
+        return moves
+
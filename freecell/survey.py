@@ -0,0 +1,92 @@
+from __future__ import annotations
+
+import argparse
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+from .deals import deal_layout
+from .solver import Solver
+from .state import GameState
+
+HEADER = "deal\tstatus\tlength\tnodes\telapsed\n"
+
+
+def shard_path(output: str, start: int, stop: int) -> str:
+    """Returns the file that holds the results of a shard"""
+    return os.path.join(output, f"shard-{start:010d}-{stop - 1:010d}.tsv")
+
+
+def pending_shards(output: str, start: int, stop: int, shard_size: int) -> list[tuple[int, int]]:
+    """Returns the shards of a range of deals that are not finished yet"""
+    shards = []
+
+    for shard_start in range(start, stop, shard_size):
+        shard_stop = min(shard_start + shard_size, stop)
+
+        if not os.path.exists(shard_path(output, shard_start, shard_stop)):
+            shards.append((shard_start, shard_stop))
+
+    return shards
+
+
+def solve_shard(output: str, start: int, stop: int, max_nodes: int, time_limit: float) -> tuple[int, int, int]:
+    """Solves the deals of a shard and returns it with the number of solved deals"""
+    solver = Solver(max_nodes, time_limit)
+    path = shard_path(output, start, stop)
+    partial_path = f"{path}.partial"
+    solved = 0
+
+    # Results are streamed to a partial file that only takes its final name once the shard is complete
+    with open(partial_path, "w") as file:
+        file.write(HEADER)
+
+        for deal in range(start, stop):
+            result = solver.solve(GameState.from_layout(deal_layout(deal)))
+            solved += result.is_solved
+            file.write(f"{deal}\t{result.status}\t{len(result.moves)}\t{result.nodes}\t{result.elapsed:.4f}\n")
+            file.flush()
+
+    os.replace(partial_path, path)
+    return (start, stop, solved)
+
+
+def main() -> None:
+    """Surveys the solvability of a range of deals with a pool of processes"""
+    parser = argparse.ArgumentParser(description="Surveys the solvability of a range of FreeCell deals")
+    parser.add_argument("first", type=int, help="first deal of the range")
+    parser.add_argument("last", type=int, help="last deal of the range (inclusive)")
+    parser.add_argument("-o", "--output", default="survey", help="directory of the shard files")
+    parser.add_argument("-w", "--workers", type=int, default=os.cpu_count(), help="number of processes")
+    parser.add_argument("--shard-size", type=int, default=1000, help="number of deals per shard")
+    parser.add_argument("--max-nodes", type=int, default=50_000, help="node budget per deal")
+    parser.add_argument("--time-limit", type=float, default=2.0, help="time budget per deal in seconds")
+    args = parser.parse_args()
+
+    os.makedirs(args.output, exist_ok=True)
+    shards = pending_shards(args.output, args.first, args.last + 1, args.shard_size)
+    deals_count = sum(stop - start for start, stop in shards)
+    print(f"{len(shards)} shards pending ({deals_count} deals) with {args.workers} workers")
+
+    start_time = time.perf_counter()
+    done_count = 0
+    solved_count = 0
+
+    with ProcessPoolExecutor(args.workers) as executor:
+        futures = [
+            executor.submit(solve_shard, args.output, start, stop, args.max_nodes, args.time_limit)
+            for start, stop in shards
+        ]
+
+        for future in as_completed(futures):
+            start, stop, solved = future.result()
+            done_count += stop - start
+            solved_count += solved
+            rate = done_count / (time.perf_counter() - start_time)
+            print(f"deals {start}-{stop - 1}: {solved}/{stop - start} solved ({done_count}/{deals_count}, {rate:.1f}/s)")
+
+    print(f"{solved_count}/{done_count} deals solved")
+
+
+if __name__ == "__main__":
+    main()
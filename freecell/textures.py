@@ -0,0 +1,92 @@
+from collections.abc import Callable
+
+import pygame
+
+from . import atlas
+from .config import Config
+
+
+class TextureCache:
+    """Class that loads each texture of the game once and shares it between sprites"""
+
+    _instance = None
+
+    def __init__(self) -> None:
+        """Instantiate the texture cache"""
+        self.config = Config.instance().default
+        self._textures: dict[tuple, pygame.Surface] = {}
+        self._atlas_size = None
+
+    @classmethod
+    def instance(cls):
+        """Returns the texture cache instance"""
+        if cls._instance is None:
+            cls._instance = cls()
+
+        return cls._instance
+
+    def get(self, sprite: str) -> pygame.Surface:
+        """Returns a sprite resized to the card size, the surface is shared and must not be modified"""
+        size = (self.config["card_width"], self.config["card_height"])
+
+        if self._atlas_size != size:
+            self._load_atlas()
+
+        key = (sprite, *size)
+        texture = self._textures.get(key)
+
+        if texture is None:
+            texture = self._load(sprite)
+            self._textures[key] = texture
+
+        return texture
+
+    def get_variant(
+        self,
+        variant: str,
+        sprite: str,
+        factory: Callable[[pygame.Surface], pygame.Surface],
+    ) -> pygame.Surface:
+        """Returns a surface derived from a sprite, created by the factory on the first request"""
+        key = (sprite, self.config["card_width"], self.config["card_height"], variant)
+        texture = self._textures.get(key)
+
+        if texture is None:
+            texture = factory(self.get(sprite))
+            self._textures[key] = texture
+
+        return texture
+
+    def get_surface(self, name: str, factory: Callable[[], pygame.Surface]) -> pygame.Surface:
+        """Returns a surface drawn at the card size by the factory on the first request"""
+        key = (name, self.config["card_width"], self.config["card_height"], None)
+        texture = self._textures.get(key)
+
+        if texture is None:
+            texture = factory()
+            self._textures[key] = texture
+
+        return texture
+
+    def invalidate(self) -> None:
+        """Discards every texture, must be called when the card size changes"""
+        self._textures.clear()
+        self._atlas_size = None
+
+    def install_atlas(self, index: dict, data: bytes) -> None:
+        """Shares the sprites of an atlas read from disk, it must be called from the main thread"""
+        sheet = pygame.image.frombuffer(data, (index["width"], index["height"]), "RGBA").convert_alpha()
+        card_width, card_height = index["card_width"], index["card_height"]
+
+        for sprite, (x, y) in index["sprites"].items():
+            self._textures[(sprite, card_width, card_height)] = sheet.subsurface((x, y, card_width, card_height))
+
+        self._atlas_size = (card_width, card_height)
+
+    def _load_atlas(self) -> None:
+        """Loads every sprite of the atlas with a single read, rebuilding the atlas when it is stale"""
+        self.install_atlas(*atlas.read_atlas(self.config["atlas_path"], self.config))
+
+    def _load(self, sprite: str) -> pygame.Surface:
+        """Loads a sprite that is not in the atlas and resizes it to the card size"""
+        return atlas.load_sprite(sprite, self.config).convert_alpha()
@@ -0,0 +1,113 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import numpy as np
+
+from .config import Config
+from .damage import DamageTracker
+from .easings import get_easing
+from .state import CARDS_COUNT
+from .subject import Subject
+
+if TYPE_CHECKING:
+    from .sprites.card import Card
+
+
+class TweenScheduler(Subject):
+    """Class that moves every card in transition towards its cell in one vectorized step per frame"""
+
+    def __init__(self, capacity: int = CARDS_COUNT, easing: str | None = None) -> None:
+        """Instantiate the tween scheduler with a slot for each card"""
+        Subject.__init__(self)
+        self.config = Config.instance().default
+        self.easing = get_easing(self.config["card_easing"] if easing is None else easing)
+
+        # Slots of the tweens, the shadow of a card follows the card
+        self.cards: list[Card | None] = [None] * capacity
+        self.slots: dict[Card, int] = {}
+
+        # A negative elapsed time is the delay before the tween starts
+        self.start_positions = np.zeros((capacity, 2))
+        self.shadow_start_offsets = np.zeros((capacity, 2))
+        self.end_positions = np.zeros((capacity, 2))
+        self.elapsed = np.zeros(capacity)
+        self.durations = np.ones(capacity)
+        self.active = np.zeros(capacity, dtype=bool)
+
+        # Cards whose tween ended in the last step
+        self.completed: list[Card] = []
+
+    def start(self, card: Card, duration: float | None = None) -> None:
+        """Moves a card from its position to the position of its state, after the delay of its moving time"""
+        slot = self.slots.get(card)
+
+        if slot is None:
+            slot = self.cards.index(None)
+            self.cards[slot] = card
+            self.slots[card] = slot
+
+        self.start_positions[slot] = card.rect.topleft
+        self.shadow_start_offsets[slot] = (card.shadow.rect.x - card.rect.x, card.shadow.rect.y - card.rect.y)
+        self.end_positions[slot] = card.get_default_pos()
+        self.elapsed[slot] = card.moving_time
+        self.durations[slot] = self.config["card_moving_time"] if duration is None else duration
+        self.active[slot] = True
+
+    def stop(self, card: Card) -> None:
+        """Stops the tween of a card where it is"""
+        slot = self.slots.pop(card, None)
+
+        if slot is not None:
+            self.cards[slot] = None
+            self.active[slot] = False
+
+    def clear(self) -> None:
+        """Stops every tween"""
+        self.cards = [None] * len(self.cards)
+        self.slots.clear()
+        self.active[:] = False
+        self.completed = []
+
+    def is_running(self) -> bool:
+        """Checks if a card is moving or waiting to move"""
+        return len(self.slots) > 0
+
+    def step(self, dt: float) -> None:
+        """Advances every tween, writes the positions to the sprites and notifies the cards that arrived"""
+        self.completed = []
+
+        if not self.slots:
+            return
+
+        active = self.active
+        self.elapsed[active] += dt
+
+        # Positions only depend on the time elapsed since the start, whatever the number of steps taken
+        progress = self.easing(np.clip(self.elapsed / self.durations, 0.0, 1.0))[:, np.newaxis]
+        positions = self.start_positions + (self.end_positions - self.start_positions) * progress
+        shadow_offsets = self.shadow_start_offsets * (1 - progress) + self.config["shadow_offset"] * progress
+        shadow_positions = np.rint(positions + shadow_offsets).astype(int).tolist()
+        positions = np.rint(positions).astype(int).tolist()
+        moving = np.flatnonzero(active & (self.elapsed >= 0)).tolist()
+        finished = np.flatnonzero(active & (self.elapsed >= self.durations)).tolist()
+
+        damage = DamageTracker.instance()
+
+        for slot in moving:
+            card = self.cards[slot]
+            previous_position = card.rect.topleft
+            card.rect.topleft = positions[slot]
+            damage.add_move(card.rect, previous_position)
+
+            previous_position = card.shadow.rect.topleft
+            card.shadow.rect.topleft = shadow_positions[slot]
+            damage.add_move(card.shadow.rect, previous_position)
+
+        for slot in finished:
+            card = self.cards[slot]
+            self.stop(card)
+            self.completed.append(card)
+
+        if self.completed:
+            self.notify()